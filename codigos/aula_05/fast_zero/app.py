@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from fast_zero.database import get_session
 from fast_zero.models import User
+from fast_zero.pagination import decode_cursor, encode_cursor
 from fast_zero.schemas import (
     Message,
     # UserDB,
@@ -53,13 +54,30 @@ def create_user(user: UserSchema, session: Session = Depends(get_session)):
     return user_public
 
 
-@app.get("/users/", response_model=UserList)
+@app.get("/users/", response_model=UserList, response_model_exclude_none=True)
 def read_users(
-    session: Session = Depends(get_session), skip: int = 0, limit: int = 100
+    session: Session = Depends(get_session),
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
 ):
-    users = session.scalars(select(User).offset(skip).limit(limit)).all()
+    query = select(User).order_by(User.id).limit(limit)
 
-    return {"users": users}
+    # Com cursor, a consulta vai direto ao próximo id pelo índice da PK,
+    # sem descartar `skip` linhas como no OFFSET
+    if cursor:
+        query = query.where(User.id > decode_cursor(cursor))
+    else:
+        query = query.offset(skip)
+
+    users = session.scalars(query).all()
+
+    # Página cheia: pode haver mais registros depois do último id
+    next_cursor = None
+    if users and len(users) == limit:
+        next_cursor = encode_cursor(users[-1].id)
+
+    return {"users": users, "next_cursor": next_cursor}
 
 
 @app.put("/users/{user_id}", response_model=UserPublic)
@@ -0,0 +1,22 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+from http import HTTPStatus
+
+from fastapi import HTTPException
+
+
+def encode_cursor(last_id: int) -> str:
+    # Cursor opaco: o cliente só devolve o valor recebido em `next_cursor`
+    return urlsafe_b64encode(str(last_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        last_id = int(urlsafe_b64decode(cursor.encode()).decode())
+    except (DecodeError, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail="Cursor de paginação inválido",
+        )
+
+    return last_id
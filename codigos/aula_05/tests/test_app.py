@@ -1,4 +1,5 @@
 from http import HTTPStatus
+from fast_zero.models import User
 from fast_zero.schemas import UserPublic
 
 
@@ -77,6 +78,35 @@ def test_get_users_not_empty(client, user):
     assert response.json() == {"users": [user]}
 
 
+# Teste de paginação por cursor (keyset)
+def test_get_users_cursor(client, session):
+    # Arrange
+    for i in range(3):
+        session.add(User(username=f"u{i}", email=f"u{i}@test.com", password="x"))
+    session.commit()
+
+    # Act
+    first_page = client.get("/users/?limit=2")
+    next_cursor = first_page.json()["next_cursor"]
+    second_page = client.get(f"/users/?limit=2&cursor={next_cursor}")
+
+    # Assert
+    assert [u["id"] for u in first_page.json()["users"]] == [1, 2]
+    assert second_page.status_code == HTTPStatus.OK
+    assert second_page.json() == {
+        "users": [{"id": 3, "username": "u2", "email": "u2@test.com"}]
+    }
+
+
+# Teste de paginação com cursor inválido
+def test_get_users_cursor_invalido(client):
+    # Act
+    response = client.get("/users/?cursor=invalido")
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
 # Teste do GET /users/unique_usernames SEM usuários cadastrados
 def test_get_unique_usernames_not_found(client):
     # Act
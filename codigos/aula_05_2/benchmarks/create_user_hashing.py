@@ -0,0 +1,80 @@
+"""Throughput do POST /users/ com hash de senha inline x pool dedicado.
+
+Uso:
+    python benchmarks/create_user_hashing.py --requests 200 --concurrency 32
+"""
+
+import argparse
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from fast_zero import app as app_module
+from fast_zero.database import get_session
+from fast_zero.models import table_registry
+from fast_zero.security import HashingPool
+
+
+def run(pool: HashingPool, requests: int, concurrency: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f'sqlite:///{os.path.join(tmp, "bench.db")}',
+            connect_args={'check_same_thread': False},
+        )
+        table_registry.metadata.create_all(engine)
+
+        def get_session_override():
+            with Session(engine) as session:
+                yield session
+
+        app_module.password_pool = pool
+        app_module.app.dependency_overrides[get_session] = get_session_override
+
+        def create(i):
+            return client.post(
+                '/users/',
+                json={
+                    'username': f'user{i}',
+                    'email': f'user{i}@bench.com',
+                    'password': 'senha-de-benchmark',
+                },
+            ).status_code
+
+        with TestClient(app_module.app) as client:
+            start = perf_counter()
+            with ThreadPoolExecutor(concurrency) as executor:
+                list(executor.map(create, range(requests)))
+            elapsed = perf_counter() - start
+
+        app_module.app.dependency_overrides.clear()
+        engine.dispose()
+
+    return requests / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--processes', action='store_true')
+    args = parser.parse_args()
+
+    modes = {
+        'inline': HashingPool(workers=0, queue_size=10_000, processes=False),
+        'pool': HashingPool(
+            workers=args.workers, queue_size=10_000, processes=args.processes
+        ),
+    }
+    for name, pool in modes.items():
+        rps = run(pool, args.requests, args.concurrency)
+        print(f'{name:>6}: {rps:8.1f} criações/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+"""Benchmark de carga da API contra um processo uvicorn real.
+
+Cria um banco SQLite em arquivo temporário, popula N usuários, sobe
+`fast_zero.app:app` com uvicorn e dispara cada cenário com concorrência
+configurável. Reporta throughput e latências p50/p95/p99 e salva o
+resultado em JSON para comparar antes/depois de mudanças.
+
+Uso:
+    python benchmarks/load.py --users 10000 --requests 500 \\
+        --concurrency 32 --output resultados.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+import httpx
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from fast_zero.models import User, table_registry
+
+FAKE_HASH = 'x' * 97
+
+
+def seed(database_url: str, users: int):
+    engine = create_engine(database_url)
+    table_registry.metadata.create_all(engine)
+    with Session(engine) as session:
+        if users:
+            session.execute(
+                insert(User),
+                [
+                    {
+                        'username': f'seed{i}',
+                        'email': f'seed{i}@bench.com',
+                        'password': FAKE_HASH,
+                    }
+                    for i in range(users)
+                ],
+            )
+        session.commit()
+    engine.dispose()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(database_url: str, port: int, workers: int):
+    env = {**os.environ, 'DATABASE_URL': database_url}
+    return subprocess.Popen(
+        [
+            sys.executable,
+            '-m',
+            'uvicorn',
+            'fast_zero.app:app',
+            '--port',
+            str(port),
+            '--workers',
+            str(workers),
+            '--log-level',
+            'warning',
+        ],
+        env=env,
+    )
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float = 30):
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        try:
+            await client.get('/users/', params={'limit': 1})
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError('uvicorn não respondeu a tempo')
+
+
+def scenarios(users: int, requests: int):
+    # Cada cenário devolve uma fábrica de requisições indexada por i
+    ids = random.sample(range(1, users + 1), min(users, 2 * requests))
+    update_ids, delete_ids = ids[:requests], ids[requests:]
+
+    def create(i):
+        return (
+            'POST',
+            '/users/',
+            {
+                'json': {
+                    'username': f'bench{i}',
+                    'email': f'bench{i}@bench.com',
+                    'password': 'senha',
+                }
+            },
+        )
+
+    def list_users(i):
+        skip = random.randrange(max(users - 100, 1))
+        return 'GET', '/users/', {'params': {'skip': skip, 'limit': 100}}
+
+    def update(i):
+        user_id = update_ids[i % len(update_ids)]
+        return (
+            'PUT',
+            f'/users/{user_id}',
+            {
+                'json': {
+                    'username': f'updated{i}',
+                    'email': f'updated{i}@bench.com',
+                    'password': 'senha',
+                }
+            },
+        )
+
+    def delete(i):
+        return 'DELETE', f'/users/{delete_ids[i]}', {}
+
+    def unique_usernames(i):
+        return 'GET', '/users/unique_usernames', {'params': {'limit': 100}}
+
+    result = {
+        'create_user': create,
+        'read_users': list_users,
+        'unique_usernames': unique_usernames,
+    }
+    if update_ids:
+        result['update_user'] = update
+    if len(delete_ids) >= requests:
+        result['delete_user'] = delete
+    return result
+
+
+async def run_scenario(client, factory, requests: int, concurrency: int):
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        nonlocal errors
+        method, url, kwargs = factory(i)
+        async with semaphore:
+            start = perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append(perf_counter() - start)
+        if response.is_error:
+            errors += 1
+
+    start = perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        'requests': requests,
+        'errors': errors,
+        'throughput_rps': requests / elapsed,
+        'p50_ms': cuts[49] * 1000,
+        'p95_ms': cuts[94] * 1000,
+        'p99_ms': cuts[98] * 1000,
+    }
+
+
+async def run(args, port: int) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=f'http://127.0.0.1:{port}', limits=limits, timeout=60
+    ) as client:
+        await wait_ready(client)
+        results = {}
+        for name, factory in scenarios(args.users, args.requests).items():
+            if args.only and name not in args.only:
+                continue
+            results[name] = await run_scenario(
+                client, factory, args.requests, args.concurrency
+            )
+            print(
+                f'{name:>16}: {results[name]["throughput_rps"]:8.1f} req/s  '
+                f'p50 {results[name]["p50_ms"]:7.2f}  '
+                f'p95 {results[name]["p95_ms"]:7.2f}  '
+                f'p99 {results[name]["p99_ms"]:7.2f} ms  '
+                f'erros {results[name]["errors"]}'
+            )
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--only', nargs='*')
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f'sqlite:///{os.path.join(tmp, "bench.db")}'
+        seed(database_url, args.users)
+
+        port = free_port()
+        server = start_server(database_url, port, args.workers)
+        try:
+            results = asyncio.run(run(args, port))
+        finally:
+            server.terminate()
+            server.wait()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(
+                {'config': vars(args), 'results': results}, file, indent=2
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Escrita e leitura concorrentes no SQLite, com e sem SQLITE_TUNING.
+
+Escritores fazem um INSERT + commit por usuário (como o POST /users/)
+enquanto leitores medem a latência da listagem paginada.
+
+Uso:
+    python benchmarks/sqlite_tuning.py --writes 2000 --writers 4 --readers 4
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+from time import perf_counter
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from fast_zero import sqlite_tuning
+from fast_zero.models import User, table_registry
+from fast_zero.pagination import Page
+from fast_zero.queries import users_page_query
+from fast_zero.settings import Settings
+
+
+def run(tuned: bool, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f'sqlite:///{os.path.join(tmp, "bench.db")}',
+            pool_size=args.writers + args.readers,
+        )
+        settings = Settings(DATABASE_URL='', SQLITE_TUNING=tuned)
+        sqlite_tuning.attach(engine, settings)
+        table_registry.metadata.create_all(engine)
+
+        done = threading.Event()
+        latencies = []
+        per_writer = args.writes // args.writers
+
+        def writer(number):
+            for i in range(per_writer):
+                with Session(engine) as session:
+                    session.execute(
+                        insert(User).values(
+                            username=f'w{number}-{i}',
+                            email=f'w{number}-{i}@bench.com',
+                            password='x' * 97,
+                        )
+                    )
+                    session.commit()
+
+        def reader():
+            query = users_page_query(Page())
+            while not done.is_set():
+                start = perf_counter()
+                with Session(engine) as session:
+                    session.execute(query).all()
+                latencies.append(perf_counter() - start)
+
+        readers = [
+            threading.Thread(target=reader) for _ in range(args.readers)
+        ]
+        writers = [
+            threading.Thread(target=writer, args=(n,))
+            for n in range(args.writers)
+        ]
+        for thread in readers:
+            thread.start()
+
+        start = perf_counter()
+        for thread in writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        elapsed = perf_counter() - start
+
+        done.set()
+        for thread in readers:
+            thread.join()
+        engine.dispose()
+
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        'writes_per_s': per_writer * args.writers / elapsed,
+        'read_p50_ms': cuts[49] * 1000,
+        'read_p99_ms': cuts[98] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--writes', type=int, default=2000)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=4)
+    args = parser.parse_args()
+
+    for tuned in (False, True):
+        result = run(tuned, args)
+        print(
+            f'{"WAL/NORMAL" if tuned else "padrão":>10}: '
+            f'{result["writes_per_s"]:8.1f} escritas/s  '
+            f'leitura p50 {result["read_p50_ms"]:6.2f} ms  '
+            f'p99 {result["read_p99_ms"]:6.2f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
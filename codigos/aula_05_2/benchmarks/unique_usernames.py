@@ -0,0 +1,106 @@
+"""Compara a implementação antiga de /users/unique_usernames com a nova.
+
+Antiga: carrega entidades User completas com OFFSET e monta os usernames
+em Python. Nova: projeta só `username` com DISTINCT ordenado e paginação
+por keyset.
+
+Uso:
+    python benchmarks/unique_usernames.py --rows 1000000 --limit 100
+"""
+
+import argparse
+import os
+import tempfile
+from time import perf_counter
+
+from sqlalchemy import Select, create_engine, insert
+from sqlalchemy.orm import Session
+
+from fast_zero.models import User, table_registry
+
+# Tamanho aproximado de um hash argon2, para as linhas pesarem o mesmo
+FAKE_HASH = 'x' * 97
+
+
+def seed(session: Session, rows: int):
+    batch = 50_000
+    for start in range(0, rows, batch):
+        session.execute(
+            insert(User),
+            [
+                {
+                    'username': f'user{i:07d}',
+                    'email': f'user{i:07d}@bench.com',
+                    'password': FAKE_HASH,
+                }
+                for i in range(start, min(start + batch, rows))
+            ],
+        )
+    session.commit()
+
+
+def old_page(session: Session, skip: int, limit: int):
+    db_users = (
+        session.scalars(Select(User).offset(skip).limit(limit)).unique().all()
+    )
+    return [user.username for user in db_users]
+
+
+def new_page(session: Session, after: str | None, limit: int):
+    query = Select(User.username).distinct().order_by(User.username)
+    if after:
+        query = query.where(User.username > after)
+    return session.scalars(query.limit(limit)).all()
+
+
+def timeit(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--limit', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f'sqlite:///{os.path.join(tmp, "bench.db")}')
+        table_registry.metadata.create_all(engine)
+
+        with Session(engine) as session:
+            seed(session, args.rows)
+
+            deep = args.rows - args.limit
+            # Usernames são gerados em ordem, o cursor equivalente a `deep`
+            # é o username da linha anterior
+            deep_cursor = f'user{deep - 1:07d}'
+
+            cases = {
+                'primeira página': (
+                    lambda: old_page(session, 0, args.limit),
+                    lambda: new_page(session, None, args.limit),
+                ),
+                'última página': (
+                    lambda: old_page(session, deep, args.limit),
+                    lambda: new_page(session, deep_cursor, args.limit),
+                ),
+            }
+            print(f'{args.rows} linhas, limit={args.limit} (melhor de N, ms)')
+            for name, (old, new) in cases.items():
+                assert sorted(old()) == new()
+                session.expunge_all()
+                old_ms = timeit(old, args.repeat)
+                new_ms = timeit(new, args.repeat)
+                print(f'{name:>16}: antiga {old_ms:8.2f}  nova {new_ms:8.2f}')
+
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,67 +1,291 @@
+import csv
+import io
+import json
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 
-from fastapi import Depends, FastAPI, HTTPException
-from sqlalchemy import Select
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, delete, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from fast_zero.database import get_session
+from fast_zero import users_async
+from fast_zero.cache import user_cache
+from fast_zero.coalescing import list_flight
+from fast_zero.database import (
+    dispose_engines,
+    get_async_engine,
+    get_engine,
+    get_read_session,
+    get_session,
+    pool_stats,
+    reads_from_primary,
+)
+from fast_zero.etag import etag_matches, users_etag
+from fast_zero.metrics import metrics_middleware, metrics_response
 from fast_zero.models import User
+from fast_zero.page_cache import page_cache
+from fast_zero.pagination import (
+    STREAM_BATCH_SIZE,
+    Page,
+    parse_int64,
+)
+from fast_zero.queries import (
+    user_insert_query,
+    user_update_query,
+    usernames_query,
+    users_page_query,
+)
+from fast_zero.query_stats import query_stats_middleware
+from fast_zero.replicas import pinned_to_primary, read_your_writes_middleware
+from fast_zero.responses import (
+    USER_LIST_COLUMNS,
+    json_response,
+    user_list_body,
+    username_list_body,
+)
 from fast_zero.schemas import (
+    BulkDeleteResult,
+    BulkUserList,
+    CacheStatsSchema,
+    CoalescingStatsSchema,
+    ExportFormat,
     Message,
+    PageCacheStatsSchema,
+    PoolStatsSchema,
+    UserBatch,
+    UserBulkDelete,
     UserList,
     UsernameList,
+    UserPatch,
     UserPublic,
     UserSchema,
 )
+from fast_zero.security import password_pool
+from fast_zero.settings import get_settings
+from fast_zero.warmup import warm_up, warm_up_async
+
+# Pronto para receber tráfego (warm-up concluído ou desabilitado)
+readiness = {'ready': False}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    if settings.DATABASE_WARMUP:
+        await run_in_threadpool(
+            warm_up, get_engine(), settings.DATABASE_POOL_SIZE
+        )
+        if settings.DATABASE_ASYNC:
+            await warm_up_async(
+                get_async_engine(), settings.DATABASE_POOL_SIZE
+            )
+    readiness['ready'] = True
+
+    yield
+
+    readiness['ready'] = False
+    await dispose_engines()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
+app.middleware('http')(query_stats_middleware)
+app.middleware('http')(metrics_middleware)
+# O cookie de read-your-writes só faz sentido quando há réplicas
+if get_settings().DATABASE_REPLICA_URLS:
+    app.middleware('http')(
+        read_your_writes_middleware(get_settings().DATABASE_READ_YOUR_WRITES)
+    )
 db = list()
 
+BULK_DELETE_CHUNK_SIZE = 500
+BATCH_FETCH_MAX_IDS = 100
+# Cada senha custa um hash argon2 dentro da requisição: importações maiores
+# devem ser divididas em várias chamadas de até este tamanho
+BULK_CREATE_MAX_USERS = 500
 
-@app.post('/users/', response_model=UserPublic, status_code=HTTPStatus.CREATED)
+# Rotas de usuários com versão async em users_async.router: só um dos dois
+# routers é registrado (ver o include_router abaixo), e o OpenAPI documenta
+# os handlers que de fato atendem
+router = APIRouter()
+
+
+@router.post(
+    '/users/', response_model=UserPublic, status_code=HTTPStatus.CREATED
+)
 def create_user(user: UserSchema, session: Session = Depends(get_session)):
-    # Busca por usuários com condição não permitida
-    # Condição: user/email devem ser unicos
-    user_in_db = session.scalar(
-        Select(User).where(
-            (User.username == user.username) | (User.email == user.email)
+    values = user.model_dump(exclude={'password'})
+    values['password'] = password_pool.hash(user.password)
+    try:
+        db_user = session.execute(user_insert_query(values)).one()
+        session.commit()
+        page_cache.bump()
+    except IntegrityError:
+        session.rollback()
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Usuário já existe'
         )
-    )
-    print('user_in_db')
-    print(user_in_db)
 
-    # Checa se o usuário já existe no bd
-    if user_in_db:
-        if user_in_db.username == user.username:
-            raise HTTPException(
-                status_code=HTTPStatus.BAD_REQUEST, detail='Usuário já existe'
-            )
-        if user_in_db.email == user.email:
-            raise HTTPException(
-                status_code=HTTPStatus.BAD_REQUEST, detail='Usuário já existe'
+    return db_user._asdict()
+
+
+@app.post('/users/bulk', response_model=BulkUserList)
+def create_users_bulk(
+    users: list[UserSchema], session: Session = Depends(get_session)
+):
+    """Cria até BULK_CREATE_MAX_USERS usuários por chamada.
+
+    Importações maiores devem ser enviadas em lotes desse tamanho.
+    """
+    if len(users) > BULK_CREATE_MAX_USERS:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=(
+                f'No máximo {BULK_CREATE_MAX_USERS} usuários por requisição;'
+                ' divida a importação em lotes'
+            ),
+        )
+
+    # Uma única consulta com IN verifica duplicatas do lote inteiro
+    usernames = {user.username for user in users}
+    emails = {user.email for user in users}
+    taken = session.execute(
+        Select(User.username, User.email).where(
+            User.username.in_(usernames) | User.email.in_(emails)
+        )
+    ).all()
+    taken_usernames = {username for username, _ in taken}
+    taken_emails = {email for _, email in taken}
+
+    results = [None] * len(users)
+    to_insert = []
+    for index, user in enumerate(users):
+        if user.username in taken_usernames or user.email in taken_emails:
+            results[index] = {
+                'index': index,
+                'created': False,
+                'detail': 'Usuário já existe',
+            }
+            continue
+
+        # Duplicatas dentro do próprio lote também são conflito
+        taken_usernames.add(user.username)
+        taken_emails.add(user.email)
+        to_insert.append((index, user.model_dump()))
+
+    # INSERT multi-linha com RETURNING, tudo em uma transação
+    if to_insert:
+        hashes = password_pool.hash_many([v['password'] for _, v in to_insert])
+        for (_, values), hashed in zip(to_insert, hashes):
+            values['password'] = hashed
+
+        statement = insert(User).returning(
+            User.id, User.username, User.email, sort_by_parameter_order=True
+        )
+        try:
+            rows = session.execute(
+                statement, [values for _, values in to_insert]
+            ).all()
+        except IntegrityError:
+            # Outra requisição inseriu um dos usernames/emails entre a
+            # verificação e o INSERT: refaz linha a linha, cada uma no seu
+            # SAVEPOINT, e reporta o conflito por item
+            session.rollback()
+            rows = []
+            for _, values in to_insert:
+                try:
+                    with session.begin_nested():
+                        rows.append(session.execute(statement, values).one())
+                except IntegrityError:
+                    rows.append(None)
+
+        session.commit()
+        page_cache.bump()
+
+        for (index, _), row in zip(to_insert, rows):
+            results[index] = (
+                {'index': index, 'created': True, 'user': row._asdict()}
+                if row
+                else {
+                    'index': index,
+                    'created': False,
+                    'detail': 'Usuário já existe',
+                }
             )
-    # Equivalente a else:
-    db_user = User(**user.model_dump())
-    session.add(db_user)
-    session.commit()
-    session.refresh(db_user)
 
-    return db_user
+    created = len([result for result in results if result['created']])
+    return {
+        'created': created,
+        'conflicts': len(users) - created,
+        'results': results,
+    }
 
 
-@app.get('/users/', response_model=UserList)
+@router.get(
+    '/users/', response_model=UserList, response_model_exclude_none=True
+)
 def read_users(
-    skip: int = 0,
-    limit: int = 100,
-    session: Session = Depends(get_session),
+    request: Request,
+    page: Page = Depends(),
+    if_none_match: str | None = Header(None),
+    session: Session = Depends(get_read_session),
 ):
-    users = session.scalars(Select(User).offset(skip).limit(limit)).all()
-    return {'users': users}
+    query = users_page_query(page)
+
+    # A geração muda a cada escrita em users: páginas de gerações antigas
+    # deixam de ser encontradas e saem pelo LRU. Páginas lidas do primário
+    # e de réplicas ficam separadas: quem acabou de escrever (fixado no
+    # primário) nunca recebe uma página de réplica atrasada
+    primary = reads_from_primary(request)
+    generation = page_cache.generation()
+    cache_key = (
+        f'users:{generation}:{"primary" if primary else "replica"}:'
+        f'{page.skip}:{page.limit}:{page.cursor or ""}'
+    )
+    cached = page_cache.get(cache_key)
+    if cached is not None:
+        etag, _, body = cached.partition(b'\n')
+        etag = etag.decode()
+    else:
+
+        def load_page():
+            users = session.execute(query).all()
+            etag, body = users_etag(users), user_list_body(users, page.limit)
+            page_cache.set(cache_key, etag.encode() + b'\n' + body)
+            return etag, body
+
+        # Requisições idênticas simultâneas compartilham a consulta e o corpo
+        # serializado
+        key = ('users', generation, page, primary)
+        etag, body = list_flight.do(key, load_page)
+
+    # Página inalterada: 304 sem enviar o corpo
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=HTTPStatus.NOT_MODIFIED, headers={'ETag': etag}
+        )
+
+    return json_response(body, {'ETag': etag})
 
 
-@app.put('/users/{user_id}', response_model=UserPublic)
+@router.put('/users/{user_id}', response_model=UserPublic)
 def update_user(
-    user: UserSchema, user_id: int, session: Session = Depends(get_session)
+    user: UserSchema,
+    user_id: int,
+    response: Response,
+    if_match: str | None = Header(None),
+    session: Session = Depends(get_session),
 ):
     # Verifica se o usuário existe
     db_user = session.scalar(Select(User).where(User.id == user_id))
@@ -71,51 +295,355 @@ def update_user(
             detail='Usuário não encontrado --> ID inválido',
         )
 
-    db_user.username = user.username
-    db_user.password = user.password
-    db_user.email = user.email
+    # If-Match: só atualiza se o cliente viu a versão atual (lost update).
+    # A comparação é forte e o UPDATE é condicional à versão lida
+    if if_match and not etag_matches(
+        if_match, users_etag([db_user]), weak=False
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.PRECONDITION_FAILED,
+            detail='Usuário foi alterado por outra requisição',
+        )
+
+    values = user.model_dump(exclude={'password'})
+    values['password'] = password_pool.hash(user.password)
+    row = session.execute(
+        user_update_query(user_id, values, db_user if if_match else None)
+    ).one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=HTTPStatus.PRECONDITION_FAILED,
+            detail='Usuário foi alterado por outra requisição',
+        )
 
     session.commit()
-    session.refresh(db_user)
-    return db_user
+    page_cache.bump()
+
+    user_public = UserPublic(id=row.id, username=row.username, email=row.email)
+    etag = users_etag([row])
+    user_cache.set(user_id, (user_public, etag))
+    response.headers['ETag'] = etag
+    return user_public
+
+
+@app.patch('/users/{user_id}', response_model=UserPublic)
+def patch_user(
+    user_id: int,
+    user: UserPatch,
+    response: Response,
+    session: Session = Depends(get_session),
+):
+    values = user.model_dump(exclude_unset=True, exclude_none=True)
+    if not values:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Nenhum campo para atualizar',
+        )
+    if 'password' in values:
+        values['password'] = password_pool.hash(values['password'])
+
+    # Um único UPDATE ... RETURNING, sem SELECT antes nem refresh depois
+    try:
+        db_user = session.execute(
+            user_update_query(user_id, values)
+        ).one_or_none()
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Usuário já existe'
+        )
+
+    if db_user is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail='Usuário não encontrado --> ID inválido',
+        )
+
+    page_cache.bump()
+    user_public = UserPublic(
+        id=db_user.id, username=db_user.username, email=db_user.email
+    )
+    etag = users_etag([db_user])
+    user_cache.set(user_id, (user_public, etag))
+    response.headers['ETag'] = etag
+    return user_public
 
 
-@app.delete('/users/{user_id}', response_model=Message)
+@app.delete('/users/', response_model=BulkDeleteResult)
+def delete_users_bulk(
+    users: UserBulkDelete, session: Session = Depends(get_session)
+):
+    if not users.ids and users.created_before is None:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Informe ids ou um filtro para remoção em lote',
+        )
+
+    conditions = []
+    if users.created_before is not None:
+        conditions.append(User.created_at < users.created_before)
+
+    deleted_ids = []
+
+    # Remove em lotes, cada um na sua própria transação curta
+    def delete_chunk(*where):
+        deleted = session.scalars(
+            delete(User).where(*where).returning(User.id)
+        ).all()
+        session.commit()
+        if deleted:
+            page_cache.bump()
+        deleted_ids.extend(deleted)
+        return deleted
+
+    if users.ids:
+        for start in range(0, len(users.ids), BULK_DELETE_CHUNK_SIZE):
+            chunk = users.ids[start : start + BULK_DELETE_CHUNK_SIZE]
+            delete_chunk(User.id.in_(chunk), *conditions)
+    else:
+        # Só filtro: remove um lote por vez até não sobrar nenhum
+        batch = (
+            Select(User.id).where(*conditions).limit(BULK_DELETE_CHUNK_SIZE)
+        )
+        while delete_chunk(User.id.in_(batch)):
+            pass
+
+    for user_id in deleted_ids:
+        user_cache.invalidate(user_id)
+
+    not_found = sorted(set(users.ids or []) - set(deleted_ids))
+    return {'deleted': len(deleted_ids), 'not_found': not_found}
+
+
+@router.delete('/users/{user_id}', response_model=Message)
 def delete_user(user_id: int, session: Session = Depends(get_session)):
-    # Verifica se o usuário existe
-    db_user = session.scalar(Select(User).where(User.id == user_id))
-    if not db_user:
+    # DELETE ... RETURNING: remove e verifica a existência em um statement
+    deleted = session.scalar(
+        delete(User).where(User.id == user_id).returning(User.id)
+    )
+    if deleted is None:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail='Usuário não encontrado --> ID inválido',
         )
 
-    session.delete(db_user)
     session.commit()
+    page_cache.bump()
+    user_cache.invalidate(user_id)
 
     return {'message': f'Usuário ID[{user_id}] deletado com sucesso.'}
 
 
+@app.get('/users/export')
+def export_users(
+    format: ExportFormat = ExportFormat.ndjson,
+    session: Session = Depends(get_read_session),
+):
+    # A sessão da dependência é fechada antes do corpo ser enviado, então o
+    # gerador abre a sua própria sobre a mesma engine
+    bind = session.get_bind()
+
+    def rows():
+        with Session(bind) as stream_session:
+            # yield_per usa cursor do lado do servidor (stream_results):
+            # a memória fica constante independente do tamanho da tabela
+            yield from stream_session.execute(
+                Select(User.id, User.username, User.email)
+                .order_by(User.id)
+                .execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+
+    def ndjson():
+        for row in rows():
+            yield json.dumps(row._asdict(), ensure_ascii=False) + '\n'
+
+    def csv_lines():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(['id', 'username', 'email'])
+        for row in rows():
+            writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if format == ExportFormat.csv:
+        return StreamingResponse(csv_lines(), media_type='text/csv')
+
+    return StreamingResponse(ndjson(), media_type='application/x-ndjson')
+
+
 # Exercício - GET de recurso único
 # Endpoint para obtenção de username únicos
-@app.get('/users/unique_usernames', response_model=UsernameList)
+@router.get(
+    '/users/unique_usernames',
+    response_model=UsernameList,
+    response_model_exclude_none=True,
+)
 def get_unique_username(
-    skip: int = 0,
-    limit: int = 100,
-    session: Session = Depends(get_session),
+    request: Request,
+    page: Page = Depends(),
+    stream: bool = False,
+    session: Session = Depends(get_read_session),
 ):
-    # Verifica se existe(m) usuário(s)
-    db_users = session.scalars(Select(User).offset(skip).limit(limit)).unique().all()  # noqa: E501
+    query = usernames_query(page)
+
+    # Modo streaming: todos os usernames a partir do cursor, sem limit
+    if stream:
+        bind = session.get_bind()
+
+        def usernames():
+            yield '{"usernames":['
+            with Session(bind) as stream_session:
+                rows = stream_session.scalars(
+                    query.execution_options(yield_per=STREAM_BATCH_SIZE)
+                )
+                for index, username in enumerate(rows):
+                    yield (',' if index else '') + json.dumps(username)
+            yield ']}'
+
+        return StreamingResponse(usernames(), media_type='application/json')
 
-    print()
-    print('db_usersdb_usersdb_usersdb_users')
-    print(db_users)
-    if len(db_users) == 0:
+    def load_usernames():
+        usernames = session.scalars(query.limit(page.limit)).all()
+        return len(usernames), username_list_body(usernames, page.limit)
+
+    key = ('usernames', page, pinned_to_primary(request))
+    count, body = list_flight.do(key, load_usernames)
+
+    # Verifica se existe(m) usuário(s)
+    if count == 0 and not page.cursor:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail='Não existem usuários cadastrados',
         )
 
-    unique_usernames = [user.username for user in db_users]
+    return json_response(body)
+
+
+# Incluído antes de /users/batch e /users/{user_id}: `unique_usernames` não
+# pode virar um id
+app.include_router(
+    users_async.router if get_settings().DATABASE_ASYNC else router
+)
+
+
+# Declarado antes de /users/{user_id} para `batch` não virar um id
+@app.get('/users/batch', response_model=UserBatch)
+def read_users_batch(
+    request: Request,
+    ids: str = Query(description='Ids separados por vírgula'),
+    session: Session = Depends(get_read_session),
+):
+    try:
+        # Ids repetidos aparecem uma vez, na ordem da primeira ocorrência
+        user_ids = list(dict.fromkeys(parse_int64(i) for i in ids.split(',')))
+    except ValueError:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Lista de ids inválida'
+        )
+
+    if len(user_ids) > BATCH_FETCH_MAX_IDS:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=f'No máximo {BATCH_FETCH_MAX_IDS} ids por requisição',
+        )
+
+    # Os que estão no cache não vão ao banco; o resto vem num único IN
+    found = {}
+    for user_id in user_ids:
+        cached = user_cache.get(user_id)
+        if cached is not None:
+            found[user_id] = cached[0]
+
+    pending = [user_id for user_id in user_ids if user_id not in found]
+    if pending:
+        # Réplica atrasada poderia devolver ao cache um usuário já alterado
+        # ou removido: só leituras do primário preenchem o cache
+        primary = reads_from_primary(request)
+        rows = session.execute(
+            Select(*USER_LIST_COLUMNS).where(User.id.in_(pending))
+        ).all()
+        for row in rows:
+            found[row.id] = UserPublic(
+                id=row.id, username=row.username, email=row.email
+            )
+            if primary:
+                user_cache.add(row.id, (found[row.id], users_etag([row])))
+
+    return {
+        'users': [found[i] for i in user_ids if i in found],
+        'missing': [i for i in user_ids if i not in found],
+    }
+
+
+@app.get('/users/{user_id}', response_model=UserPublic)
+def read_user(
+    user_id: int,
+    request: Request,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    session: Session = Depends(get_read_session),
+):
+    # Perfis acessados com frequência saem do cache sem ir ao banco
+    cached = user_cache.get(user_id)
+    if cached is None:
+        db_user = session.scalar(Select(User).where(User.id == user_id))
+        if not db_user:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail='Usuário não encontrado --> ID inválido',
+            )
+
+        cached = (UserPublic.model_validate(db_user), users_etag([db_user]))
+        # Mesmo cuidado do batch: réplica não repõe dados antigos no cache.
+        # `add` não sobrescreve o que uma escrita concorrente já gravou
+        if reads_from_primary(request):
+            user_cache.add(user_id, cached)
+
+    user_public, etag = cached
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=HTTPStatus.NOT_MODIFIED, headers={'ETag': etag}
+        )
+
+    response.headers['ETag'] = etag
+    return user_public
+
+
+@app.get('/cache/stats', response_model=CacheStatsSchema)
+def read_cache_stats():
+    return user_cache.stats()
+
+
+@app.get('/cache/pages/stats', response_model=PageCacheStatsSchema)
+def read_page_cache_stats():
+    return page_cache.stats()
+
+
+@app.get('/coalescing/stats', response_model=CoalescingStatsSchema)
+def read_coalescing_stats():
+    return list_flight.stats()
+
+
+# Readiness para o load balancer: 503 até o warm-up terminar
+@app.get('/health/ready', response_model=Message)
+def read_readiness(response: Response):
+    if not readiness['ready']:
+        response.status_code = HTTPStatus.SERVICE_UNAVAILABLE
+        return {'message': 'aquecendo'}
+
+    return {'message': 'pronto'}
+
+
+# Estatísticas do pool de conexões, para investigar picos de latência
+@app.get('/pool/stats', response_model=PoolStatsSchema)
+def read_pool_stats():
+    return pool_stats.snapshot()
+
 
-    return {'usernames': unique_usernames}
+# Métricas no formato texto do Prometheus (latência por rota e em andamento)
+@app.get('/metrics', include_in_schema=False)
+def read_metrics():
+    return metrics_response()
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+from fast_zero.settings import get_settings
+
+# Marca de chave invalidada: ocupa a entrada até expirar, para que uma
+# leitura que começou antes da escrita não devolva ao cache a versão antiga
+TOMBSTONE = object()
+
+
+class LRUCache:
+    """Cache em memória do processo com descarte LRU e expiração por TTL.
+
+    Escritas usam `set`/`invalidate`; leituras preenchem com `add`, que só
+    grava se a chave está ausente. Uma leitura lenta não sobrescreve o
+    valor que um PUT/PATCH gravou nem desfaz um DELETE (`invalidate`
+    deixa um TOMBSTONE até o TTL).
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[1] < monotonic():
+                self._data.pop(key, None)
+                self.misses += 1
+                return None
+            if item[0] is TOMBSTONE:
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._store(key, value)
+
+    def add(self, key, value) -> bool:
+        if self.maxsize <= 0:
+            return False
+
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[1] >= monotonic():
+                return False
+
+            self._store(key, value)
+            return True
+
+    def invalidate(self, key):
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._store(key, TOMBSTONE)
+
+    def _store(self, key, value):
+        self._data[key] = (value, monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+settings = get_settings()
+
+# UserPublic por id, preenchido na leitura (`add`) e atualizado/invalidado
+# na escrita (`set`/`invalidate`)
+user_cache = LRUCache(settings.USER_CACHE_MAXSIZE, settings.USER_CACHE_TTL)
@@ -0,0 +1,100 @@
+from threading import Event, Lock
+from time import monotonic
+
+from fast_zero.settings import get_settings
+
+
+class _Call:
+    def __init__(self):
+        self.done = Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """Uma única execução por chave entre requisições concorrentes.
+
+    A primeira requisição (líder) executa a função; as idênticas que chegam
+    enquanto ela está em andamento esperam e recebem o mesmo resultado (ou
+    a mesma exceção). Quem espera mais que `wait_timeout` (líder travado)
+    desiste e executa a função por conta própria. Com `reuse_seconds > 0`,
+    o resultado ainda é reaproveitado por essa janela depois de concluído.
+    """
+
+    def __init__(self, reuse_seconds: float = 0, wait_timeout: float = 10):
+        self.reuse_seconds = reuse_seconds
+        self.wait_timeout = wait_timeout
+        self._calls = {}
+        self._results = {}
+        self._lock = Lock()
+        self.leaders = 0
+        self.coalesced = 0
+        self.reused = 0
+        self.timeouts = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None and result[1] > monotonic():
+                self.reused += 1
+                return result[0]
+
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not call.done.wait(self.wait_timeout):
+                with self._lock:
+                    self.timeouts += 1
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None and self.reuse_seconds > 0:
+                    self._store(key, call.value)
+            call.done.set()
+
+        return call.value
+
+    def _store(self, key, value):
+        # Descarta os vencidos: a janela é curta, o dicionário fica pequeno
+        now = monotonic()
+        self._results = {
+            k: item for k, item in self._results.items() if item[1] > now
+        }
+        self._results[key] = (value, now + self.reuse_seconds)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'in_flight': len(self._calls),
+                'leaders': self.leaders,
+                'coalesced': self.coalesced,
+                'reused': self.reused,
+                'timeouts': self.timeouts,
+            }
+
+
+# Listagens de usuários (GET /users/ e /users/unique_usernames)
+list_flight = SingleFlight(
+    get_settings().COALESCING_REUSE_SECONDS,
+    get_settings().COALESCING_WAIT_TIMEOUT,
+)
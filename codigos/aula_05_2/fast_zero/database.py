@@ -1,11 +1,135 @@
-from sqlalchemy import create_engine
+from functools import lru_cache
+
+from fastapi import Request
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from fast_zero import query_stats, sqlite_tuning
+from fast_zero.pool_stats import PoolStats, timed_pool
+from fast_zero.replicas import ReplicaRouter, pinned_to_primary
+from fast_zero.settings import Settings, get_settings
+
+pool_stats = PoolStats()
+
+
+def pool_options(url: str, settings: Settings) -> dict:
+    options = {
+        'pool_recycle': settings.DATABASE_POOL_RECYCLE,
+        'pool_pre_ping': settings.DATABASE_POOL_PRE_PING,
+    }
+
+    # Tamanho, overflow e timeout só existem nos pools com fila: SQLite em
+    # memória usa SingletonThreadPool/StaticPool e recusaria esses argumentos
+    database_url = make_url(url)
+    pool_class = database_url.get_dialect().get_pool_class(database_url)
+    if issubclass(pool_class, QueuePool):
+        options |= {
+            'poolclass': timed_pool(pool_class, pool_stats),
+            'pool_size': settings.DATABASE_POOL_SIZE,
+            'max_overflow': settings.DATABASE_MAX_OVERFLOW,
+            'pool_timeout': settings.DATABASE_POOL_TIMEOUT,
+        }
+
+    return options
+
+
+# As engines só são criadas no primeiro uso: importar fast_zero.app (CLI,
+# testes, ferramentas) não monta pool nem carrega drivers
+def build_engine(url: str, settings: Settings) -> Engine:
+    engine = create_engine(url, **pool_options(url, settings))
+
+    sqlite_tuning.attach(engine, settings)
+    pool_stats.attach(engine.pool)
+    # Contagem e tempo de queries por requisição (Server-Timing)
+    query_stats.attach(engine)
+    return engine
+
+
+@lru_cache
+def get_engine() -> Engine:
+    settings = get_settings()
+    return build_engine(settings.DATABASE_URL, settings)
+
+
+@lru_cache
+def get_replica_router() -> ReplicaRouter | None:
+    settings = get_settings()
+    if not settings.DATABASE_REPLICA_URLS:
+        return None
+
+    return ReplicaRouter(
+        [
+            build_engine(url, settings)
+            for url in settings.DATABASE_REPLICA_URLS
+        ],
+        settings.DATABASE_REPLICA_STRATEGY,
+    )
 
-from fast_zero.settings import Settings
 
-engine = create_engine(Settings().DATABASE_URL)
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    settings = get_settings()
+    # As migrações (Alembic) continuam usando a URL síncrona
+    url = settings.ASYNC_DATABASE_URL or settings.DATABASE_URL.replace(
+        'sqlite://', 'sqlite+aiosqlite://', 1
+    )
+    async_engine = create_async_engine(url, **pool_options(url, settings))
 
+    sqlite_tuning.attach(async_engine.sync_engine, settings)
+    pool_stats.attach(async_engine.sync_engine.pool)
+    query_stats.attach(async_engine.sync_engine)
+    return async_engine
 
+
+async def dispose_engines():
+    # Fecha as conexões do pool no shutdown, só das engines já criadas
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+        get_engine.cache_clear()
+
+    if get_replica_router.cache_info().currsize:
+        router = get_replica_router()
+        for engine in router.engines if router else []:
+            engine.dispose()
+        get_replica_router.cache_clear()
+
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+        get_async_engine.cache_clear()
+
+
+# As sessões só pegam uma conexão do pool no primeiro statement: rotas que
+# respondem do cache não ocupam conexão. A espera é medida no próprio pool
 def get_session():
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
+        yield session
+
+
+def get_read_session(request: Request):
+    # Rotas somente leitura: réplica, a menos que o cliente tenha escrito há
+    # pouco (read-your-writes) ou não haja réplicas configuradas
+    router = get_replica_router()
+    if router is None or pinned_to_primary(request):
+        yield from get_session()
+        return
+
+    with Session(router.choose()) as session:
+        yield session
+
+
+def reads_from_primary(request: Request) -> bool:
+    return get_replica_router() is None or pinned_to_primary(request)
+
+
+async def get_async_session():
+    async with AsyncSession(
+        get_async_engine(), expire_on_commit=False
+    ) as session:
         yield session
@@ -0,0 +1,30 @@
+from hashlib import sha1
+
+
+def users_etag(users) -> str:
+    """ETag forte calculado a partir de id e updated_at de cada usuário.
+
+    username/email também entram no hash: o CURRENT_TIMESTAMP do SQLite
+    tem resolução de segundos e duas escritas no mesmo segundo manteriam
+    o mesmo updated_at.
+    """
+    digest = sha1(usedforsecurity=False)
+    for user in users:
+        digest.update(
+            f'{user.id}|{user.updated_at.isoformat()}|'
+            f'{user.username}|{user.email};'.encode()
+        )
+
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(header: str | None, etag: str, weak: bool = True) -> bool:
+    # Aceita lista separada por vírgulas e `*`. If-None-Match usa comparação
+    # fraca (W/ vale); If-Match usa `weak=False`: validador fraco não casa
+    if not header:
+        return False
+
+    candidates = [tag.strip() for tag in header.split(',')]
+    if weak:
+        candidates = [tag.removeprefix('W/') for tag in candidates]
+    return '*' in candidates or etag in candidates
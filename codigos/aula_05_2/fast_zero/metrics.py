@@ -0,0 +1,68 @@
+import os
+from time import perf_counter
+
+from fastapi import Request, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.routing import Match
+
+# Com PROMETHEUS_MULTIPROC_DIR definido, cada worker do uvicorn grava suas
+# métricas em arquivos nesse diretório e o /metrics agrega todos eles
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Latência das requisições HTTP',
+    ['method', 'route', 'status'],
+)
+IN_FLIGHT = Gauge(
+    'http_requests_in_flight',
+    'Requisições HTTP em andamento',
+    ['method', 'route'],
+    multiprocess_mode='livesum',
+)
+
+
+def route_template(request: Request) -> str:
+    # Usa o template da rota (/users/{user_id}) e não o caminho bruto,
+    # mantendo a cardinalidade dos labels limitada
+    for route in request.app.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+
+    return 'unmatched'
+
+
+async def metrics_middleware(request: Request, call_next):
+    method = request.method
+    route = route_template(request)
+
+    in_flight = IN_FLIGHT.labels(method, route)
+    in_flight.inc()
+    start = perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        REQUEST_LATENCY.labels(method, route, str(status)).observe(
+            perf_counter() - start
+        )
+        in_flight.dec()
+
+    return response
+
+
+def metrics_response() -> Response:
+    registry = REGISTRY
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
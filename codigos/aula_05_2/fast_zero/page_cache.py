@@ -0,0 +1,253 @@
+import sqlite3
+from collections import OrderedDict
+from threading import Lock, local
+from time import time
+
+from fast_zero.settings import Settings, get_settings
+
+# O `used` de uma página no SQLite só é regravado se estiver mais velho que
+# isto: páginas quentes não viram uma escrita a cada hit
+RECENCY_RESOLUTION = 1.0
+# Quantas páginas antigas cada rodada de descarte lê de uma vez
+EVICTION_BATCH = 16
+
+
+def _meta(conn: sqlite3.Connection, name: str) -> int:
+    return conn.execute(
+        'SELECT value FROM meta WHERE name = ?', (name,)
+    ).fetchone()[0]
+
+
+def _add_bytes(conn: sqlite3.Connection, delta: int) -> int:
+    conn.execute(
+        "UPDATE meta SET value = value + ? WHERE name = 'bytes'", (delta,)
+    )
+    return _meta(conn, 'bytes')
+
+
+class MemoryPageCache:
+    """Páginas serializadas em memória do processo, LRU limitado em bytes.
+
+    A geração da tabela users faz parte da chave: `bump()` invalida todas
+    as páginas em O(1) e as antigas saem pelo LRU. A geração é do processo:
+    com vários workers, uma escrita em um deles não invalida os outros, e
+    o `ttl` limita por quanto tempo eles servem uma página antiga.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def generation(self) -> int:
+        return self._generation
+
+    def bump(self):
+        with self._lock:
+            self._generation += 1
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[1] < time():
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key: str, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._data.pop(key, None)
+            self._bytes += len(value) - (len(old[0]) if old else 0)
+            self._data[key] = (value, time() + self.ttl)
+            while self._bytes > self.max_bytes:
+                _, (evicted, _) = self._data.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'backend': 'memory',
+                'generation': self._generation,
+                'size': len(self._data),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+class SQLitePageCache:
+    """Mesmo contrato do MemoryPageCache, num arquivo SQLite local.
+
+    Páginas e geração ficam compartilhadas entre os workers da máquina:
+    uma escrita em um worker invalida as páginas de todos. Cada thread usa
+    a sua conexão; um hit só escreve quando a recência da página está
+    mais velha que RECENCY_RESOLUTION. O total de bytes fica na tabela
+    meta e o descarte remove só as páginas necessárias, pelo índice de
+    `used`. Os contadores de hits/misses/evictions são do processo.
+    """
+
+    def __init__(self, path: str, max_bytes: int, ttl: float):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._local = local()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # Abre o arquivo só no primeiro uso (importar o módulo não cria nada)
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA busy_timeout=5000')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, '
+                'value BLOB, size INTEGER, used REAL, expires REAL)'
+            )
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS pages_used ON pages (used)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS meta ('
+                'name TEXT PRIMARY KEY, value INTEGER)'
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO meta VALUES ('generation', 0), "
+                "('bytes', 0)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def _count(self, counter: str, amount: int = 1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def generation(self) -> int:
+        return _meta(self._connection(), 'generation')
+
+    def bump(self):
+        self._connection().execute(
+            "UPDATE meta SET value = value + 1 WHERE name = 'generation'"
+        )
+
+    def get(self, key: str) -> bytes | None:
+        conn = self._connection()
+        now = time()
+        row = conn.execute(
+            'SELECT value, used FROM pages WHERE key = ? AND expires > ?',
+            (key, now),
+        ).fetchone()
+        if row is None:
+            self._count('misses')
+            return None
+
+        value, used = row
+        if now - used > RECENCY_RESOLUTION:
+            conn.execute('UPDATE pages SET used = ? WHERE key = ?', (now, key))
+        self._count('hits')
+        return value
+
+    def set(self, key: str, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            evicted = self._store(conn, key, value)
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        conn.execute('COMMIT')
+        self._count('evictions', evicted)
+
+    def _store(self, conn: sqlite3.Connection, key: str, value: bytes):
+        now = time()
+        old = conn.execute(
+            'SELECT size FROM pages WHERE key = ?', (key,)
+        ).fetchone()
+        conn.execute(
+            'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)',
+            (key, value, len(value), now, now + self.ttl),
+        )
+        total = _add_bytes(conn, len(value) - (old[0] if old else 0))
+
+        # Descarta só o necessário, das menos usadas, pelo índice de `used`
+        evicted = 0
+        while total > self.max_bytes:
+            oldest = conn.execute(
+                'SELECT key, size FROM pages WHERE key != ? '
+                'ORDER BY used LIMIT ?',
+                (key, EVICTION_BATCH),
+            ).fetchall()
+            for old_key, size in oldest:
+                if total <= self.max_bytes:
+                    break
+                conn.execute('DELETE FROM pages WHERE key = ?', (old_key,))
+                total = _add_bytes(conn, -size)
+                evicted += 1
+
+        return evicted
+
+    def clear(self):
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        conn.execute('DELETE FROM pages')
+        conn.execute("UPDATE meta SET value = 0 WHERE name = 'bytes'")
+        conn.execute('COMMIT')
+
+    def stats(self) -> dict:
+        conn = self._connection()
+        (size,) = conn.execute('SELECT COUNT(*) FROM pages').fetchone()
+        with self._lock:
+            return {
+                'backend': 'sqlite',
+                'generation': _meta(conn, 'generation'),
+                'size': size,
+                'bytes': _meta(conn, 'bytes'),
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+def create_page_cache(settings: Settings):
+    if settings.PAGE_CACHE_BACKEND == 'sqlite':
+        return SQLitePageCache(
+            settings.PAGE_CACHE_PATH,
+            settings.PAGE_CACHE_MAX_BYTES,
+            settings.PAGE_CACHE_TTL,
+        )
+
+    return MemoryPageCache(
+        settings.PAGE_CACHE_MAX_BYTES, settings.PAGE_CACHE_TTL
+    )
+
+
+# Respostas de GET /users/ (ETag + corpo), chaveadas pela geração de users
+page_cache = create_page_cache(get_settings())
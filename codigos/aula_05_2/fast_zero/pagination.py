@@ -0,0 +1,49 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from fastapi import HTTPException
+
+# Linhas por lote nas consultas com cursor do lado do servidor (yield_per)
+STREAM_BATCH_SIZE = 1000
+# Faixa do INTEGER do banco (int64): fora dela o driver levanta OverflowError
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+def parse_int64(text: str) -> int:
+    # ValueError também para valores fora da faixa, tratado como entrada
+    # inválida pelos chamadores (400 em vez de 500)
+    value = int(text)
+    if not INT64_MIN <= value <= INT64_MAX:
+        raise ValueError(f'{value} fora da faixa de int64')
+
+    return value
+
+
+def encode_cursor(last_key: int | str) -> str:
+    # Cursor opaco: o cliente só devolve o valor recebido em `next_cursor`
+    return urlsafe_b64encode(str(last_key).encode()).decode()
+
+
+def decode_cursor(cursor: str, cast=parse_int64):
+    # `cast` converte a chave de volta ao tipo da coluna (id, username...)
+    try:
+        last_key = cast(urlsafe_b64decode(cursor.encode()).decode())
+    except (DecodeError, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Cursor de paginação inválido',
+        )
+
+    return last_key
+
+
+@dataclass(frozen=True)
+class Page:
+    # Parâmetros de paginação (query string) compartilhados pelas listagens.
+    # Imutável: serve de chave para o coalescing
+    skip: int = 0
+    limit: int = 100
+    cursor: str | None = None
@@ -0,0 +1,94 @@
+from threading import Lock, local
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.pool import Pool, QueuePool
+
+
+class PoolStats:
+    """Contadores do pool de conexões alimentados pelos eventos do
+    SQLAlchemy (connect, checkout, checkin e close)."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checked_out = 0
+        self.checkouts = 0
+        self.connects = 0
+        self.disconnects = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def attach(self, pool: Pool):
+        event.listen(pool, 'connect', self._on_connect)
+        event.listen(pool, 'checkout', self._on_checkout)
+        event.listen(pool, 'checkin', self._on_checkin)
+        # Uma conexão invalidada também dispara `close` quando é descartada:
+        # ouvir `invalidate` contaria a mesma desconexão duas vezes
+        event.listen(pool, 'close', self._on_disconnect)
+
+    def record_wait(self, seconds: float):
+        # Tempo gasto esperando uma conexão livre (até o pool_timeout)
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'checked_out': self.checked_out,
+                'checkouts': self.checkouts,
+                'connects': self.connects,
+                'disconnects': self.disconnects,
+                'wait_seconds_total': self.wait_seconds_total,
+                'wait_seconds_max': self.wait_seconds_max,
+            }
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, proxy):
+        with self._lock:
+            self.checked_out += 1
+            self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checked_out -= 1
+
+    def _on_disconnect(self, dbapi_connection, connection_record, *args):
+        with self._lock:
+            self.disconnects += 1
+
+
+def timed_pool(pool_class: type[QueuePool], stats: PoolStats) -> type:
+    """Subclasse do pool que mede a espera por uma conexão livre.
+
+    O tempo é medido no próprio checkout do pool, então a sessão só pega
+    uma conexão no primeiro statement (respostas do cache não ocupam o
+    pool). A abertura de uma conexão nova (overflow) não é espera e é
+    descontada. Sobrevive ao `dispose()`, que recria o pool com a mesma
+    classe.
+    """
+    # Tempo gasto abrindo conexões no checkout em andamento, por thread
+    connecting = local()
+
+    class TimedPool(pool_class):
+        def _create_connection(self):
+            start = perf_counter()
+            try:
+                return super()._create_connection()
+            finally:
+                spent = perf_counter() - start
+                connecting.seconds = getattr(connecting, 'seconds', 0) + spent
+
+        def _do_get(self):
+            connecting.seconds = 0.0
+            start = perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                elapsed = perf_counter() - start
+                stats.record_wait(elapsed - connecting.seconds)
+
+    return TimedPool
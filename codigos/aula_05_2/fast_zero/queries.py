@@ -0,0 +1,60 @@
+from sqlalchemy import Insert, Select, Update, insert, update
+
+from fast_zero.models import User
+from fast_zero.pagination import Page, decode_cursor
+from fast_zero.responses import USER_LIST_COLUMNS
+
+
+# Consultas das listagens, compartilhadas pelos endpoints sync/async e pelo
+# warm-up de inicialização
+def users_page_query(page: Page) -> Select:
+    query = Select(*USER_LIST_COLUMNS).order_by(User.id).limit(page.limit)
+
+    # Com cursor, a consulta vai direto ao próximo id pelo índice da PK,
+    # sem descartar `skip` linhas como no OFFSET
+    if page.cursor:
+        return query.where(User.id > decode_cursor(page.cursor))
+
+    return query.offset(page.skip)
+
+
+def usernames_query(page: Page) -> Select:
+    # Projeta só a coluna username: o DISTINCT ordenado usa o índice unique
+    # e senhas/emails não trafegam do banco. Sem limit (modo streaming)
+    query = Select(User.username).distinct().order_by(User.username)
+    if page.cursor:
+        return query.where(User.username > decode_cursor(page.cursor, str))
+
+    return query.offset(page.skip)
+
+
+def user_insert_query(values: dict) -> Insert:
+    # Sem SELECT prévio: as constraints unique de username/email detectam a
+    # duplicata no próprio INSERT, sem corrida entre verificação e inserção
+    return (
+        insert(User)
+        .values(**values)
+        .returning(User.id, User.username, User.email)
+    )
+
+
+def user_update_query(user_id: int, values: dict, seen=None) -> Update:
+    # Com If-Match (`seen` = linha lida pelo handler), o UPDATE só acontece
+    # se a linha ainda é a versão que o cliente viu: duas requisições com o
+    # mesmo ETag não passam ambas. Compara as colunas graváveis em vez do
+    # updated_at (resolução de segundos e formato de texto no SQLite); o
+    # hash da senha muda a cada PUT, já que o salt é novo
+    query = update(User).where(User.id == user_id)
+    if seen is not None:
+        query = query.where(
+            User.username == seen.username,
+            User.email == seen.email,
+            User.password == seen.password,
+        )
+
+    return (
+        query
+        .values(**values)
+        .returning(*USER_LIST_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
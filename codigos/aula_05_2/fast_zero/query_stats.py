@@ -0,0 +1,105 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger('fast_zero.queries')
+
+# Controle de transação (ex.: SAVEPOINTs das fixtures de teste) não conta
+TRANSACTION_CONTROL = ('BEGIN', 'SAVEPOINT', 'RELEASE', 'ROLLBACK', 'COMMIT')
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def add(self, duration: float):
+        self.count += 1
+        self.duration += duration
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries"'
+
+
+# Estatísticas da requisição atual; os handlers síncronos rodam no
+# threadpool com uma cópia do contexto, que aponta para o mesmo objeto
+current_stats: ContextVar[QueryStats | None] = ContextVar(
+    'current_stats', default=None
+)
+# Contadores abertos por `count_queries` (testes), independentes da request
+_observers: list[QueryStats] = []
+
+
+# O início fica no contexto de execução do statement, não na conexão: se o
+# statement falha, `after_cursor_execute` não dispara e nada sobra na
+# conexão do pool. Falhas (ex.: IntegrityError de duplicata) são contadas
+# e cronometradas pelo `handle_error`
+def _before_cursor_execute(conn, cursor, statement, params, context, *_):
+    if context is not None:
+        context._query_start_time = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, params, context, *_):
+    _record(statement, context)
+
+
+def _handle_error(exception_context):
+    _record(exception_context.statement, exception_context.execution_context)
+
+
+def _record(statement, context):
+    start = getattr(context, '_query_start_time', None)
+    if start is None or statement is None:
+        return
+
+    duration = perf_counter() - start
+    if statement.lstrip().upper().startswith(TRANSACTION_CONTROL):
+        return
+
+    stats = current_stats.get()
+    if stats is not None:
+        stats.add(duration)
+    for observer in _observers:
+        observer.add(duration)
+
+
+def attach(engine: Engine):
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+    event.listen(engine, 'handle_error', _handle_error)
+
+
+async def query_stats_middleware(request: Request, call_next):
+    stats = QueryStats()
+    token = current_stats.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        current_stats.reset(token)
+
+    response.headers['Server-Timing'] = stats.server_timing()
+    logger.info(
+        '%s %s: %d queries em %.2f ms',
+        request.method,
+        request.url.path,
+        stats.count,
+        stats.duration * 1000,
+    )
+    return response
+
+
+@contextmanager
+def count_queries():
+    """Conta os statements executados dentro do bloco, em qualquer
+    requisição ou sessão com a engine instrumentada."""
+    stats = QueryStats()
+    _observers.append(stats)
+    try:
+        yield stats
+    finally:
+        _observers.remove(stats)
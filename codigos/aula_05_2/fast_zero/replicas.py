@@ -0,0 +1,56 @@
+from http import HTTPStatus
+from itertools import cycle
+from threading import Lock
+from time import time
+
+from fastapi import Request
+from sqlalchemy import Engine
+
+# Cookie que fixa o cliente no primário logo após uma escrita
+PRIMARY_COOKIE = 'fast_zero_primary_until'
+WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+
+class ReplicaRouter:
+    """Escolhe a engine de réplica para as rotas somente leitura."""
+
+    def __init__(self, engines: list[Engine], strategy: str):
+        self.engines = engines
+        self.strategy = strategy
+        self._cycle = cycle(engines)
+        self._lock = Lock()
+
+    def choose(self) -> Engine:
+        if self.strategy == 'least_connections':
+            return min(self.engines, key=lambda e: e.pool.checkedout())
+
+        with self._lock:
+            return next(self._cycle)
+
+
+def pinned_to_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(PRIMARY_COOKIE, 0)) > time()
+    except ValueError:
+        return False
+
+
+def read_your_writes_middleware(window: float):
+    # Após uma escrita bem-sucedida, o cliente lê do primário por `window`
+    # segundos e não vê uma réplica ainda atrasada
+    async def middleware(request: Request, call_next):
+        response = await call_next(request)
+        if (
+            window > 0
+            and request.method in WRITE_METHODS
+            and response.status_code < HTTPStatus.BAD_REQUEST
+        ):
+            response.set_cookie(
+                PRIMARY_COOKIE,
+                str(time() + window),
+                max_age=int(window) + 1,
+                httponly=True,
+            )
+        return response
+
+    return middleware
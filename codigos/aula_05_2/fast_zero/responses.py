@@ -0,0 +1,49 @@
+import orjson
+from fastapi import Response
+
+from fast_zero.models import User
+from fast_zero.pagination import encode_cursor
+
+# Colunas lidas pelas listagens: só o que vai na resposta e no ETag
+USER_LIST_COLUMNS = (User.id, User.username, User.email, User.updated_at)
+
+
+# Caminho rápido das listagens: o JSON é montado direto das tuplas do banco
+# e serializado com orjson, sem passar cada linha pelo UserPublic (dados
+# vindos do banco já são confiáveis). A saída é byte a byte igual à do
+# encoder padrão da FastAPI.
+def json_response(body: bytes, headers: dict | None = None) -> Response:
+    return Response(body, media_type='application/json', headers=headers)
+
+
+# Os corpos são bytes prontos: podem ser compartilhados entre requisições
+# (coalescing) e cada uma monta o seu próprio Response
+def user_list_body(rows, limit: int) -> bytes:
+    payload = {
+        'users': [
+            {'id': row.id, 'username': row.username, 'email': row.email}
+            for row in rows
+        ]
+    }
+
+    # Página cheia: pode haver mais registros depois do último id
+    if rows and len(rows) == limit:
+        payload['next_cursor'] = encode_cursor(rows[-1].id)
+
+    return orjson.dumps(payload)
+
+
+def user_list_response(rows, limit: int, etag: str) -> Response:
+    return json_response(user_list_body(rows, limit), {'ETag': etag})
+
+
+def username_list_body(usernames, limit: int) -> bytes:
+    payload = {'usernames': list(usernames)}
+    if usernames and len(usernames) == limit:
+        payload['next_cursor'] = encode_cursor(usernames[-1])
+
+    return orjson.dumps(payload)
+
+
+def username_list_response(usernames, limit: int) -> Response:
+    return json_response(username_list_body(usernames, limit))
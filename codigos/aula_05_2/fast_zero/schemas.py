@@ -1,3 +1,6 @@
+from datetime import datetime
+from enum import Enum
+
 from pydantic import BaseModel, ConfigDict, EmailStr
 
 
@@ -11,6 +14,12 @@ class UserSchema(BaseModel):
     password: str
 
 
+class UserPatch(BaseModel):
+    username: str | None = None
+    email: EmailStr | None = None
+    password: str | None = None
+
+
 class UserPublic(BaseModel):
     id: int
     username: str
@@ -18,13 +27,83 @@ class UserPublic(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BulkUserResult(BaseModel):
+    index: int
+    created: bool
+    user: UserPublic | None = None
+    detail: str | None = None
+
+
+class BulkUserList(BaseModel):
+    created: int
+    conflicts: int
+    results: list[BulkUserResult]
+
+
+class UserBulkDelete(BaseModel):
+    ids: list[int] | None = None
+    created_before: datetime | None = None
+
+
+class BulkDeleteResult(BaseModel):
+    deleted: int
+    not_found: list[int]
+
+
+class UserBatch(BaseModel):
+    users: list[UserPublic]
+    missing: list[int]
+
+
 class UserDB(UserSchema):
     id: int
 
 
 class UserList(BaseModel):
     users: list[UserPublic]
+    next_cursor: str | None = None
 
 
 class UsernameList(BaseModel):
     usernames: list[str]
+    next_cursor: str | None = None
+
+
+class PoolStatsSchema(BaseModel):
+    checked_out: int
+    checkouts: int
+    connects: int
+    disconnects: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class CacheStatsSchema(BaseModel):
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class PageCacheStatsSchema(BaseModel):
+    backend: str
+    generation: int
+    size: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class CoalescingStatsSchema(BaseModel):
+    in_flight: int
+    leaders: int
+    coalesced: int
+    reused: int
+    timeouts: int
+
+
+class ExportFormat(str, Enum):
+    ndjson = 'ndjson'
+    csv = 'csv'
@@ -0,0 +1,138 @@
+import asyncio
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from http import HTTPStatus
+from threading import BoundedSemaphore
+
+from fastapi import HTTPException
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from fast_zero.settings import get_settings
+
+settings = get_settings()
+
+# Espera máxima (s) por vagas para as janelas seguintes de um lote
+BATCH_WINDOW_TIMEOUT = 30
+
+pwd_context = PasswordHash((
+    Argon2Hasher(
+        time_cost=settings.PASSWORD_HASH_TIME_COST,
+        memory_cost=settings.PASSWORD_HASH_MEMORY_COST,
+        parallelism=settings.PASSWORD_HASH_PARALLELISM,
+    ),
+))
+
+
+def get_password_hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class HashingPool:
+    """Executa hash/verificação de senhas num pool dedicado, com fila
+    limitada: com `workers + queue_size` tarefas pendentes, novas
+    requisições recebem 503 em vez de se acumularem e piorarem o p99.
+
+    Só `hash_async`/`verify_async` liberam quem chamou enquanto o hash
+    roda. `hash`/`verify` (handlers síncronos) esperam com `.result()`: a
+    thread do threadpool da AnyIO continua ocupada durante todo o hash, e
+    o ganho nesse caminho é apenas o limite de concorrência e o 503.
+    """
+
+    def __init__(self, workers: int, queue_size: int, processes: bool):
+        self._executor = None
+        if workers > 0:
+            executor_class = (
+                ProcessPoolExecutor if processes else ThreadPoolExecutor
+            )
+            self._executor = executor_class(max_workers=workers)
+        self._window = max(workers, 1)
+        self._slots = BoundedSemaphore(self._window + queue_size)
+
+    def _acquire(self, count: int = 1, timeout: float | None = None):
+        # Tudo ou nada: sem vagas para as `count` tarefas, devolve as já
+        # obtidas e responde 503
+        acquired = 0
+        for _ in range(count):
+            if timeout is None:
+                ok = self._slots.acquire(blocking=False)
+            else:
+                ok = self._slots.acquire(timeout=timeout)
+            if not ok:
+                for _ in range(acquired):
+                    self._slots.release()
+                raise HTTPException(
+                    status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                    detail='Servidor ocupado, tente novamente',
+                )
+            acquired += 1
+
+    def submit(self, fn, *args) -> Future:
+        self._acquire()
+        return self._run(fn, *args)
+
+    def _run(self, fn, *args) -> Future:
+        # Executa uma tarefa cuja vaga já foi obtida; a vaga volta ao fim
+        if self._executor is None:
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as exc:
+                future.set_exception(exc)
+        else:
+            future = self._executor.submit(fn, *args)
+
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def hash(self, password: str) -> str:
+        # Bloqueia a thread chamadora até o hash terminar (ver docstring)
+        return self.submit(get_password_hash, password).result()
+
+    def hash_many(self, passwords: list[str]) -> list[str]:
+        # Cada senha ocupa uma vaga, em janelas de `workers` senhas: o lote
+        # nunca enfileira mais do que o pool comporta e os cadastros
+        # individuais continuam achando vaga entre uma janela e outra. A
+        # primeira janela só entra se houver vagas agora (senão 503); as
+        # seguintes esperam as vagas liberadas, até BATCH_WINDOW_TIMEOUT
+        hashes = []
+        for start in range(0, len(passwords), self._window):
+            window = passwords[start : start + self._window]
+            self._acquire(
+                len(window), timeout=BATCH_WINDOW_TIMEOUT if start else None
+            )
+            futures = [self._run(get_password_hash, p) for p in window]
+            hashes.extend(future.result() for future in futures)
+
+        return hashes
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self.submit(
+            verify_password, plain_password, hashed_password
+        ).result()
+
+    async def hash_async(self, password: str) -> str:
+        return await asyncio.wrap_future(
+            self.submit(get_password_hash, password)
+        )
+
+    async def verify_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        return await asyncio.wrap_future(
+            self.submit(verify_password, plain_password, hashed_password)
+        )
+
+
+password_pool = HashingPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    processes=settings.PASSWORD_HASH_PROCESSES,
+)
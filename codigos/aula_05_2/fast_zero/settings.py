@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,3 +10,76 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str
+    # Modo async: endpoints de usuários com AsyncSession (aiosqlite local).
+    # Substitui POST/PUT/DELETE /users/{id}, GET /users/ e
+    # /users/unique_usernames pelas versões de users_async, que NÃO têm
+    # page cache, coalescing nem réplicas de leitura (sempre o primário).
+    # As demais rotas (bulk, PATCH, export, batch, GET /users/{id})
+    # continuam síncronas, com todos os recursos
+    DATABASE_ASYNC: bool = False
+    # Se vazio, usa DATABASE_URL trocando o driver sqlite por aiosqlite
+    ASYNC_DATABASE_URL: str | None = None
+
+    # Pool de conexões (padrões iguais aos do SQLAlchemy)
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_RECYCLE: int = -1
+    DATABASE_POOL_PRE_PING: bool = False
+
+    # Hash de senhas (argon2) em um pool dedicado; 0 workers = hash inline.
+    # Nos handlers síncronos a thread da requisição ainda espera o hash:
+    # o pool limita a concorrência (503 com a fila cheia), não libera threads
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 64
+    PASSWORD_HASH_PROCESSES: bool = False
+    PASSWORD_HASH_TIME_COST: int = 3
+    PASSWORD_HASH_MEMORY_COST: int = 65536
+    PASSWORD_HASH_PARALLELISM: int = 4
+
+    # Cache de leitura de usuários individuais (GET /users/{user_id})
+    USER_CACHE_MAXSIZE: int = 1024
+    USER_CACHE_TTL: float = 60
+
+    # Páginas de GET /users/ já serializadas, invalidadas a cada escrita.
+    # `memory` é por processo: com vários workers, uma escrita só invalida
+    # o próprio worker e os demais servem a página antiga por até
+    # PAGE_CACHE_TTL segundos. `sqlite` compartilha páginas e invalidação
+    # entre os workers da máquina. O modo async não usa este cache
+    PAGE_CACHE_BACKEND: Literal['memory', 'sqlite'] = 'memory'
+    PAGE_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+    PAGE_CACHE_TTL: float = 5
+    PAGE_CACHE_PATH: str = 'page_cache.db'
+
+    # Warm-up na inicialização: abre o pool, compila as consultas e prepara
+    # os schemas antes de responder como pronto em /health/ready
+    DATABASE_WARMUP: bool = False
+
+    # Listagens concorrentes idênticas compartilham uma única consulta;
+    # o resultado ainda é reaproveitado por esta janela (s). 0 desliga
+    COALESCING_REUSE_SECONDS: float = 0
+    # Espera máxima (s) pelo líder; depois disso a requisição consulta sozinha
+    COALESCING_WAIT_TIMEOUT: float = 10
+
+    # Réplicas de leitura: rotas somente leitura usam uma delas
+    DATABASE_REPLICA_URLS: list[str] = []
+    DATABASE_REPLICA_STRATEGY: Literal['round_robin', 'least_connections'] = (
+        'round_robin'
+    )
+    # Janela (s) em que o cliente lê do primário após escrever; 0 desliga
+    DATABASE_READ_YOUR_WRITES: float = 5
+
+    # Perfil de desempenho do SQLite (PRAGMAs aplicados a cada conexão)
+    SQLITE_TUNING: bool = False
+    SQLITE_JOURNAL_MODE: str = 'WAL'
+    SQLITE_SYNCHRONOUS: str = 'NORMAL'
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE: int = -64_000  # negativo = KiB
+    SQLITE_TEMP_STORE: str = 'MEMORY'
+    SQLITE_BUSY_TIMEOUT: int = 5000  # ms
+
+
+@lru_cache
+def get_settings() -> Settings:
+    # O .env é lido e validado uma única vez por processo
+    return Settings()
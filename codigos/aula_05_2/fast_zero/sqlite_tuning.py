@@ -0,0 +1,33 @@
+from sqlalchemy import Engine, event
+
+from fast_zero.settings import Settings
+
+
+def sqlite_pragmas(settings: Settings) -> dict:
+    return {
+        'journal_mode': settings.SQLITE_JOURNAL_MODE,
+        'synchronous': settings.SQLITE_SYNCHRONOUS,
+        'mmap_size': settings.SQLITE_MMAP_SIZE,
+        'cache_size': settings.SQLITE_CACHE_SIZE,
+        'temp_store': settings.SQLITE_TEMP_STORE,
+        'busy_timeout': settings.SQLITE_BUSY_TIMEOUT,
+    }
+
+
+def attach(engine: Engine, settings: Settings):
+    """Aplica os PRAGMAs de desempenho em cada nova conexão SQLite.
+
+    WAL deixa leitores e escritor concorrentes e, com synchronous=NORMAL,
+    o commit não faz fsync a cada transação (só nos checkpoints).
+    """
+    if not settings.SQLITE_TUNING or engine.dialect.name != 'sqlite':
+        return
+
+    pragmas = sqlite_pragmas(settings)
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+        cursor.close()
@@ -0,0 +1,190 @@
+import json
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fast_zero.cache import user_cache
+from fast_zero.database import get_async_session
+from fast_zero.etag import etag_matches, users_etag
+from fast_zero.models import User
+from fast_zero.page_cache import page_cache
+from fast_zero.pagination import (
+    STREAM_BATCH_SIZE,
+    Page,
+)
+from fast_zero.queries import (
+    user_insert_query,
+    user_update_query,
+    usernames_query,
+    users_page_query,
+)
+from fast_zero.responses import (
+    user_list_response,
+    username_list_response,
+)
+from fast_zero.schemas import (
+    Message,
+    UserList,
+    UsernameList,
+    UserPublic,
+    UserSchema,
+)
+from fast_zero.security import password_pool
+
+# Versões async dos endpoints de usuários, habilitadas com DATABASE_ASYNC.
+# Rodam direto no event loop, sem ocupar o threadpool do AnyIO.
+router = APIRouter()
+
+
+@router.post(
+    '/users/', response_model=UserPublic, status_code=HTTPStatus.CREATED
+)
+async def create_user_async(
+    user: UserSchema, session: AsyncSession = Depends(get_async_session)
+):
+    values = user.model_dump(exclude={'password'})
+    values['password'] = await password_pool.hash_async(user.password)
+    try:
+        db_user = (await session.execute(user_insert_query(values))).one()
+        await session.commit()
+        page_cache.bump()
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Usuário já existe'
+        )
+
+    return db_user._asdict()
+
+
+@router.get(
+    '/users/', response_model=UserList, response_model_exclude_none=True
+)
+async def read_users_async(
+    page: Page = Depends(),
+    if_none_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+):
+    query = users_page_query(page)
+
+    users = (await session.execute(query)).all()
+
+    etag = users_etag(users)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=HTTPStatus.NOT_MODIFIED, headers={'ETag': etag}
+        )
+
+    return user_list_response(users, page.limit, etag)
+
+
+@router.put('/users/{user_id}', response_model=UserPublic)
+async def update_user_async(
+    user: UserSchema,
+    user_id: int,
+    response: Response,
+    if_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+):
+    db_user = await session.scalar(Select(User).where(User.id == user_id))
+    if not db_user:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail='Usuário não encontrado --> ID inválido',
+        )
+
+    # If-Match: só atualiza se o cliente viu a versão atual (lost update).
+    # A comparação é forte e o UPDATE é condicional à versão lida
+    if if_match and not etag_matches(
+        if_match, users_etag([db_user]), weak=False
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.PRECONDITION_FAILED,
+            detail='Usuário foi alterado por outra requisição',
+        )
+
+    values = user.model_dump(exclude={'password'})
+    values['password'] = await password_pool.hash_async(user.password)
+    row = (
+        await session.execute(
+            user_update_query(user_id, values, db_user if if_match else None)
+        )
+    ).one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=HTTPStatus.PRECONDITION_FAILED,
+            detail='Usuário foi alterado por outra requisição',
+        )
+
+    await session.commit()
+    page_cache.bump()
+
+    user_public = UserPublic(id=row.id, username=row.username, email=row.email)
+    etag = users_etag([row])
+    user_cache.set(user_id, (user_public, etag))
+    response.headers['ETag'] = etag
+    return user_public
+
+
+@router.delete('/users/{user_id}', response_model=Message)
+async def delete_user_async(
+    user_id: int, session: AsyncSession = Depends(get_async_session)
+):
+    deleted = await session.scalar(
+        delete(User).where(User.id == user_id).returning(User.id)
+    )
+    if deleted is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail='Usuário não encontrado --> ID inválido',
+        )
+
+    await session.commit()
+    page_cache.bump()
+    user_cache.invalidate(user_id)
+
+    return {'message': f'Usuário ID[{user_id}] deletado com sucesso.'}
+
+
+@router.get(
+    '/users/unique_usernames',
+    response_model=UsernameList,
+    response_model_exclude_none=True,
+)
+async def get_unique_username_async(
+    page: Page = Depends(),
+    stream: bool = False,
+    session: AsyncSession = Depends(get_async_session),
+):
+    query = usernames_query(page)
+
+    if stream:
+        bind = session.bind
+
+        async def usernames():
+            yield '{"usernames":['
+            async with AsyncSession(bind) as stream_session:
+                rows = await stream_session.stream_scalars(
+                    query.execution_options(yield_per=STREAM_BATCH_SIZE)
+                )
+                index = 0
+                async for username in rows:
+                    yield (',' if index else '') + json.dumps(username)
+                    index += 1
+            yield ']}'
+
+        return StreamingResponse(usernames(), media_type='application/json')
+
+    usernames = (await session.scalars(query.limit(page.limit))).all()
+
+    if len(usernames) == 0 and not page.cursor:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail='Não existem usuários cadastrados',
+        )
+
+    return username_list_response(usernames, page.limit)
@@ -0,0 +1,104 @@
+import logging
+from time import perf_counter
+from uuid import uuid4
+
+from sqlalchemy import Engine, Select, delete
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from fast_zero.models import User
+from fast_zero.pagination import Page, encode_cursor
+from fast_zero.queries import (
+    user_insert_query,
+    user_update_query,
+    usernames_query,
+    users_page_query,
+)
+from fast_zero.responses import user_list_response
+from fast_zero.schemas import UserList, UserPublic, UserSchema
+
+logger = logging.getLogger('fast_zero.warmup')
+
+# Id inexistente: UPDATE/DELETE de warm-up não afetam nenhuma linha
+NO_USER = -1
+
+
+def read_statements() -> list:
+    # Mesmas formas de statement dos endpoints: o cache de compilação do
+    # SQLAlchemy é indexado pela estrutura, não pelos valores
+    page = Page()
+    return [
+        users_page_query(page),
+        users_page_query(Page(cursor=encode_cursor(0))),
+        usernames_query(page).limit(page.limit),
+        usernames_query(Page(cursor=encode_cursor(''))).limit(page.limit),
+        Select(User).where(User.id == NO_USER),
+    ]
+
+
+def write_statements() -> list:
+    # Construídas pelos mesmos builders dos handlers. O INSERT grava uma
+    # linha de verdade (valores únicos, para não colidir com a base): só
+    # rode dentro de uma transação que será desfeita
+    marker = uuid4().hex
+    user = {
+        'username': f'warmup-{marker}',
+        'email': f'warmup-{marker}@example.com',
+        'password': marker,
+    }
+    seen = User(**user)
+    return [
+        user_insert_query(user),
+        # PUT sem e com If-Match, e PATCH só de email
+        user_update_query(NO_USER, user),
+        user_update_query(NO_USER, user, seen),
+        user_update_query(NO_USER, {'email': user['email']}),
+        delete(User).where(User.id == NO_USER).returning(User.id),
+    ]
+
+
+def hot_statements() -> list:
+    return read_statements() + write_statements()
+
+
+def warm_pool(engine: Engine, connections: int):
+    # Abre as conexões ao mesmo tempo para o pool guardar todas ociosas
+    opened = [engine.connect() for _ in range(connections)]
+    for connection in opened:
+        connection.close()
+
+
+def warm_statements(engine: Engine):
+    # Tudo numa transação desfeita no fim: o INSERT de warm-up não persiste
+    with Session(engine) as session:
+        for statement in hot_statements():
+            session.execute(statement)
+        session.rollback()
+
+
+def warm_schemas():
+    # Primeira validação/serialização inicializa validators (EmailStr...)
+    user = {'id': 0, 'username': 'warmup', 'email': 'warmup@example.com'}
+    UserSchema.model_validate({**user, 'password': 'warmup'})
+    UserList(users=[UserPublic.model_validate(user)]).model_dump_json()
+    user_list_response([], limit=1, etag='""')
+
+
+def warm_up(engine: Engine, connections: int):
+    start = perf_counter()
+    warm_pool(engine, connections)
+    warm_statements(engine)
+    warm_schemas()
+    logger.info('warm-up concluído em %.2f s', perf_counter() - start)
+
+
+async def warm_up_async(engine: AsyncEngine, connections: int):
+    opened = [await engine.connect() for _ in range(connections)]
+    for connection in opened:
+        await connection.close()
+
+    # No modo async, só as leituras (nada a desfazer)
+    async with engine.connect() as connection:
+        for statement in read_statements():
+            await connection.execute(statement)
+        await connection.rollback()
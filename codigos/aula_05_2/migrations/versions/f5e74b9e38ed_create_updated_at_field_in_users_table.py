@@ -0,0 +1,30 @@
+"""create updated_at field in users table
+
+Revision ID: f5e74b9e38ed
+Revises: a3b6c595479d
+Create Date: 2026-10-18 18:23:05.482587
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5e74b9e38ed'
+down_revision: Union[str, None] = 'a3b6c595479d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # O SQLite não aceita ADD COLUMN com default não constante em tabelas
+    # com dados, então a tabela é recriada em modo batch
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('updated_at')
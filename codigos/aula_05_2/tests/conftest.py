@@ -1,11 +1,24 @@
+import asyncio
+from contextlib import contextmanager
+
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import StaticPool, create_engine
+from sqlalchemy import StaticPool, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
 
+from fast_zero import users_async
 from fast_zero.app import app
-from fast_zero.database import get_session
+from fast_zero.cache import user_cache
+from fast_zero.database import (
+    get_async_session,
+    get_read_session,
+    get_session,
+)
 from fast_zero.models import User, table_registry
+from fast_zero.page_cache import page_cache
+from fast_zero.query_stats import attach, count_queries
 
 
 @pytest.fixture
@@ -15,30 +28,58 @@ def client(session):
 
     with TestClient(app) as client:
         app.dependency_overrides[get_session] = get_session_override
+        app.dependency_overrides[get_read_session] = get_session_override
         yield client
 
     app.dependency_overrides.clear()
+    user_cache.clear()
+    page_cache.clear()
 
 
-@pytest.fixture
-def session():
-    # Cria uma sessão com uma instancia sqlite em memoria para testes
+@pytest.fixture(scope='session')
+def engine():
+    # Engine e tabelas criadas uma única vez para toda a sessão de testes.
+    # Com pytest-xdist cada worker é um processo e tem o seu próprio banco
+    # em memória, isolado dos demais
     engine = create_engine(
         'sqlite:///:memory:',
         connect_args={'check_same_thread': False},
         poolclass=StaticPool,
     )
 
-    # Cria as tabelas no banco de testes
+    # O pysqlite não emite BEGIN/SAVEPOINT corretamente por conta própria;
+    # a transação passa a ser controlada pelo SQLAlchemy
+    @event.listens_for(engine, 'connect')
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def do_begin(conn):
+        conn.exec_driver_sql('BEGIN')
+
+    attach(engine)
     table_registry.metadata.create_all(engine)
 
-    # Injeta a sessão toda vez que for chamada a fixture
-    with Session(engine) as session:
-        yield session
+    yield engine
 
-    # Dropa todas as tabelas da instância do banco de testes após finalizar
-    # o teste que o chamou
     table_registry.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    # Cada teste roda dentro de uma transação externa; commits/rollbacks da
+    # aplicação viram SAVEPOINTs e tudo é desfeito ao final do teste
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    with Session(
+        bind=connection, join_transaction_mode='create_savepoint'
+    ) as session:
+        yield session
+
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
@@ -49,3 +90,49 @@ def user(session):
     session.refresh(user)
 
     return user
+
+
+@pytest.fixture
+def async_client():
+    # App só com as rotas async, sobre um sqlite em memória via aiosqlite
+    engine = create_async_engine(
+        'sqlite+aiosqlite:///:memory:', poolclass=StaticPool
+    )
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(table_registry.metadata.create_all)
+
+    asyncio.run(create_tables())
+
+    async def get_async_session_override():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    async_app = FastAPI()
+    async_app.include_router(users_async.router)
+    async_app.dependency_overrides[get_async_session] = (
+        get_async_session_override
+    )
+
+    with TestClient(async_app) as client:
+        yield client
+
+    user_cache.clear()
+
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def assert_max_queries():
+    # Uso: with assert_max_queries(2): client.get(...)
+    @contextmanager
+    def checker(max_queries):
+        with count_queries() as stats:
+            yield stats
+
+        assert stats.count <= max_queries, (
+            f'{stats.count} queries executadas, máximo {max_queries}'
+        )
+
+    return checker
@@ -1,5 +1,10 @@
 from http import HTTPStatus
 
+from fast_zero.app import BATCH_FETCH_MAX_IDS, BULK_CREATE_MAX_USERS, app
+from fast_zero.models import User
+from fast_zero.pagination import INT64_MAX, encode_cursor
+from fast_zero.security import password_pool
+
 
 def test_create_user_ok(client):
     # Act
@@ -53,6 +58,91 @@ def test_create_user_email_existente(client, user):
     assert response.json()['detail'] == 'Usuário já existe'
 
 
+def test_create_user_apos_conflito(client, user):
+    # Arrange
+    conflito = {'username': 'teste', 'password': 'kel', 'email': 'a@b.com'}
+    client.post(url='/users/', json=conflito)
+
+    # Act
+    response = client.post(
+        url='/users/',
+        json={'username': 'kenan', 'password': 'kel', 'email': 'a@b.com'},
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json()['username'] == 'kenan'
+
+
+BULK_CREATED = 2
+
+
+def test_create_users_bulk(client, user):
+    # Arrange
+    users = [
+        {'username': 'kenan', 'password': 'kel', 'email': 'kenan@kel.com'},
+        {'username': 'teste', 'password': 'kel', 'email': 'outro@kel.com'},
+        {'username': 'kel', 'password': 'kel', 'email': 'kel@kel.com'},
+        {'username': 'kel', 'password': 'kel', 'email': 'kel2@kel.com'},
+    ]
+
+    # Act
+    response = client.post('/users/bulk', json=users)
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['created'] == BULK_CREATED
+    assert [r['created'] for r in response.json()['results']] == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert response.json()['results'][2]['user'] == {
+        'id': 3,
+        'username': 'kel',
+        'email': 'kel@kel.com',
+    }
+
+
+def test_create_users_bulk_acima_do_limite(client):
+    users = [
+        {'username': f'u{i}', 'password': 'x', 'email': f'u{i}@x.com'}
+        for i in range(BULK_CREATE_MAX_USERS + 1)
+    ]
+
+    response = client.post('/users/bulk', json=users)
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_create_users_bulk_corrida_no_insert(client, session, monkeypatch):
+    # Arrange: outra requisição cria 'ana' depois da verificação por IN
+    hash_many = password_pool.hash_many
+
+    def hash_many_com_corrida(passwords):
+        session.add(User(username='ana', email='ana@x.com', password='x'))
+        session.commit()
+        return hash_many(passwords)
+
+    monkeypatch.setattr(password_pool, 'hash_many', hash_many_com_corrida)
+    users = [
+        {'username': 'ana', 'password': 'x', 'email': 'ana2@x.com'},
+        {'username': 'bia', 'password': 'x', 'email': 'bia@x.com'},
+    ]
+
+    # Act
+    response = client.post('/users/bulk', json=users)
+
+    # Assert: conflito reportado por item, o resto criado
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['created'] == 1
+    assert [r['created'] for r in response.json()['results']] == [
+        False,
+        True,
+    ]
+
+
 def test_get_users_bd_vazio(client):
     # Act
     response = client.get('/users/')
@@ -76,6 +166,46 @@ def test_get_users_ok(client, user):
     # assert response.json() == {'users': [user_schema]}
 
 
+def test_get_users_cursor_paginacao(client, session):
+    # Arrange
+    for i in range(3):
+        session.add(
+            User(username=f'u{i}', email=f'u{i}@test.com', password='senha')
+        )
+    session.commit()
+
+    # Act
+    first_page = client.get('/users/?limit=2')
+    next_cursor = first_page.json()['next_cursor']
+    second_page = client.get(f'/users/?limit=2&cursor={next_cursor}')
+
+    # Assert
+    assert [u['id'] for u in first_page.json()['users']] == [1, 2]
+    assert second_page.status_code == HTTPStatus.OK
+    assert second_page.json() == {
+        'users': [{'username': 'u2', 'email': 'u2@test.com', 'id': 3}]
+    }
+
+
+def test_get_users_cursor_invalido(client):
+    # Act
+    response = client.get('/users/?cursor=invalido')
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()['detail'] == 'Cursor de paginação inválido'
+
+
+def test_get_users_cursor_fora_do_int64(client):
+    # Act: cursor com o id 2**63, acima do INTEGER do banco
+    cursor = encode_cursor(INT64_MAX + 1)
+    response = client.get(f'/users/?cursor={cursor}')
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()['detail'] == 'Cursor de paginação inválido'
+
+
 def test_update_user_ok(client, user):
     # Act
     response = client.put(
@@ -139,6 +269,30 @@ def test_delete_users_ok(client, user):
     assert response.json() == msg
 
 
+def test_export_users_ndjson(client, user):
+    # Act
+    response = client.get('/users/export')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert response.text == (
+        '{"id": 1, "username": "teste", "email": "teste@test.com"}\n'
+    )
+
+
+def test_export_users_csv(client, user):
+    # Act
+    response = client.get('/users/export?format=csv')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.text.splitlines() == [
+        'id,username,email',
+        '1,teste,teste@test.com',
+    ]
+
+
 # Exercício - teste com db não-vazio
 def test_get_unique_username_ok(client, user):
     # Act
@@ -148,6 +302,33 @@ def test_get_unique_username_ok(client, user):
     assert response.json() == {'usernames': ['teste']}
 
 
+def test_get_unique_username_cursor(client, session):
+    # Arrange
+    for name in ['carla', 'ana', 'bia']:
+        session.add(User(username=name, email=f'{name}@t.com', password='x'))
+    session.commit()
+
+    # Act
+    first_page = client.get('/users/unique_usernames?limit=2')
+    next_cursor = first_page.json()['next_cursor']
+    second_page = client.get(
+        f'/users/unique_usernames?limit=2&cursor={next_cursor}'
+    )
+
+    # Assert
+    assert first_page.json()['usernames'] == ['ana', 'bia']
+    assert second_page.json() == {'usernames': ['carla']}
+
+
+def test_get_unique_username_stream(client, user):
+    # Act
+    response = client.get('/users/unique_usernames?stream=true')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'usernames': ['teste']}
+
+
 # Exercício - teste prevendo falha com db vazio
 def test_get_unique_username_empty(client):
     # Act
@@ -158,6 +339,14 @@ def test_get_unique_username_empty(client):
     assert response.json() == msg
 
 
+def test_get_unique_username_limit_zero(client, user):
+    # Act
+    response = client.get('/users/unique_usernames?limit=0')
+
+    # Assert: nenhuma linha pedida, sem erro ao montar o cursor
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
 # Exercício - Teste de atualização prevendo falha de ID inválido
 def test_put_invalid_id(client):
     # Arrange
@@ -187,3 +376,148 @@ def test_delete_invalid_id(client):
 
     # Assert
     assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_patch_user_ok(client, user, assert_max_queries):
+    # Act
+    with assert_max_queries(1):
+        response = client.patch('/users/1', json={'email': 'novo@test.com'})
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        'id': 1,
+        'username': 'teste',
+        'email': 'novo@test.com',
+    }
+    assert client.get('/users/1').json()['email'] == 'novo@test.com'
+
+
+def test_patch_user_not_found(client):
+    # Act
+    response = client.patch('/users/1', json={'username': 'chris'})
+
+    # Assert
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_patch_user_username_existente(client, user, session):
+    # Arrange
+    session.add(User(username='chris', email='chris@test.com', password='x'))
+    session.commit()
+
+    # Act
+    response = client.patch('/users/1', json={'username': 'chris'})
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()['detail'] == 'Usuário já existe'
+
+
+def test_patch_user_sem_campos(client, user):
+    # Act
+    response = client.patch('/users/1', json={})
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_delete_user_uma_query(client, user, assert_max_queries):
+    # Act
+    with assert_max_queries(1):
+        response = client.delete('/users/1')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_delete_users_bulk_ids(client, session):
+    # Arrange
+    for name in ['ana', 'bia', 'carla']:
+        session.add(User(username=name, email=f'{name}@t.com', password='x'))
+    session.commit()
+
+    # Act
+    response = client.request('DELETE', '/users/', json={'ids': [1, 3, 42]})
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'deleted': 2, 'not_found': [42]}
+    assert client.get('/users/unique_usernames').json()['usernames'] == ['bia']
+
+
+def test_delete_users_bulk_filtro(client, user):
+    # Act
+    response = client.request(
+        'DELETE', '/users/', json={'created_before': '2999-01-01T00:00:00'}
+    )
+
+    # Assert
+    assert response.json() == {'deleted': 1, 'not_found': []}
+    assert client.get('/users/').json() == {'users': []}
+
+
+def test_delete_users_bulk_sem_criterio(client, user):
+    # Act
+    response = client.request('DELETE', '/users/', json={})
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_read_users_batch_mantem_ordem_e_informa_ausentes(
+    client, session, assert_max_queries
+):
+    # Arrange
+    users = [
+        User(username=f'batch{i}', email=f'batch{i}@test.com', password='x')
+        for i in range(3)
+    ]
+    session.add_all(users)
+    session.commit()
+    first, _, third = (user.id for user in users)
+    missing = third + 100
+
+    # Act
+    with assert_max_queries(1):
+        response = client.get(
+            f'/users/batch?ids={third},{missing},{first},{third}'
+        )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert [u['id'] for u in response.json()['users']] == [third, first]
+    assert response.json()['missing'] == [missing]
+
+
+def test_read_users_batch_ids_invalidos(client):
+    response = client.get('/users/batch?ids=1,abc')
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': 'Lista de ids inválida'}
+
+
+def test_read_users_batch_id_fora_do_int64(client):
+    response = client.get(f'/users/batch?ids=1,{INT64_MAX + 1}')
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': 'Lista de ids inválida'}
+
+
+def test_read_users_batch_acima_do_limite(client):
+    ids = ','.join(str(i) for i in range(BATCH_FETCH_MAX_IDS + 1))
+
+    response = client.get(f'/users/batch?ids={ids}')
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_rotas_de_usuarios_registradas_uma_vez():
+    # Sync ou async: cada método/caminho tem um único handler registrado
+    routes = [
+        (method, route.path)
+        for route in app.routes
+        for method in getattr(route, 'methods', ())
+    ]
+
+    assert len(routes) == len(set(routes))
@@ -0,0 +1,72 @@
+from http import HTTPStatus
+
+USER = {
+    'username': 'kenan',
+    'password': 'kel',
+    'email': 'kenan@kel.com',
+}
+
+
+def test_create_user_async_ok(async_client):
+    # Act
+    response = async_client.post('/users/', json=USER)
+
+    # Assert
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json() == {
+        'email': 'kenan@kel.com',
+        'username': 'kenan',
+        'id': 1,
+    }
+
+
+def test_create_user_async_existente(async_client):
+    # Arrange
+    async_client.post('/users/', json=USER)
+
+    # Act
+    response = async_client.post('/users/', json=USER)
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()['detail'] == 'Usuário já existe'
+
+
+def test_crud_async(async_client):
+    # Arrange
+    async_client.post('/users/', json=USER)
+
+    # Act
+    users = async_client.get('/users/')
+    usernames = async_client.get('/users/unique_usernames')
+    updated = async_client.put('/users/1', json={**USER, 'username': 'chris'})
+    deleted = async_client.delete('/users/1')
+    not_found = async_client.delete('/users/1')
+
+    # Assert
+    assert users.json() == {
+        'users': [{'username': 'kenan', 'email': 'kenan@kel.com', 'id': 1}]
+    }
+    assert usernames.json() == {'usernames': ['kenan']}
+    assert updated.json()['username'] == 'chris'
+    assert deleted.status_code == HTTPStatus.OK
+    assert not_found.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_get_unique_username_async_empty(async_client):
+    # Act
+    response = async_client.get('/users/unique_usernames')
+
+    # Assert
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_get_unique_username_async_stream(async_client):
+    # Arrange
+    async_client.post('/users/', json=USER)
+
+    # Act
+    response = async_client.get('/users/unique_usernames?stream=true')
+
+    # Assert
+    assert response.json() == {'usernames': ['kenan']}
@@ -0,0 +1,106 @@
+from http import HTTPStatus
+
+from fast_zero.cache import LRUCache, user_cache
+
+
+def test_lru_cache_descarta_mais_antigo():
+    # Arrange
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set(1, 'a')
+    cache.set(2, 'b')
+    cache.get(1)
+
+    # Act
+    cache.set(3, 'c')
+
+    # Assert
+    assert cache.get(2) is None
+    assert cache.get(1) == 'a'
+    assert cache.stats()['evictions'] == 1
+
+
+def test_lru_cache_expira_por_ttl():
+    # Arrange
+    cache = LRUCache(maxsize=2, ttl=0)
+    cache.set(1, 'a')
+
+    # Act
+    value = cache.get(1)
+
+    # Assert
+    assert value is None
+    assert cache.stats() == {'size': 0, 'hits': 0, 'misses': 1, 'evictions': 0}
+
+
+def test_lru_cache_leitura_nao_sobrescreve_escrita():
+    # Arrange: a escrita grava a versão nova antes da leitura lenta terminar
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set(1, 'nova')
+
+    # Act
+    added = cache.add(1, 'antiga')
+
+    # Assert
+    assert added is False
+    assert cache.get(1) == 'nova'
+
+
+def test_lru_cache_leitura_nao_desfaz_invalidacao():
+    # Arrange
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set(1, 'a')
+    cache.invalidate(1)
+
+    # Act
+    added = cache.add(1, 'a')
+
+    # Assert
+    assert added is False
+    assert cache.get(1) is None
+    assert cache.add(2, 'b') is True
+
+
+def test_read_user_usa_cache(client, user):
+    # Act
+    first = client.get('/users/1')
+    hits_before = user_cache.hits
+    second = client.get('/users/1')
+
+    # Assert
+    assert (
+        first.json()
+        == second.json()
+        == {
+            'id': 1,
+            'username': 'teste',
+            'email': 'teste@test.com',
+        }
+    )
+    assert user_cache.hits == hits_before + 1
+
+
+def test_read_user_cache_atualizado_e_invalidado(client, user):
+    # Arrange
+    client.get('/users/1')
+
+    # Act
+    client.put(
+        '/users/1',
+        json={'username': 'chris', 'password': 'x', 'email': 'c@market.com'},
+    )
+    updated = client.get('/users/1')
+    client.delete('/users/1')
+    deleted = client.get('/users/1')
+
+    # Assert
+    assert updated.json()['username'] == 'chris'
+    assert deleted.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_read_cache_stats(client):
+    # Act
+    response = client.get('/cache/stats')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert set(response.json()) == {'size', 'hits', 'misses', 'evictions'}
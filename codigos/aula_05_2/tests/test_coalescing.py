@@ -0,0 +1,142 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from threading import Event
+
+import pytest
+
+from fast_zero.coalescing import SingleFlight
+
+# Limite das esperas: um teste quebrado falha em vez de travar a suíte
+TIMEOUT = 5
+POLL_INTERVAL = 0.01
+SEQUENTIAL_CALLS = 2
+
+
+def wait_until(condition) -> bool:
+    tick = Event()
+    for _ in range(int(TIMEOUT / POLL_INTERVAL)):
+        if condition():
+            return True
+        tick.wait(POLL_INTERVAL)
+    return False
+
+
+def test_requisicoes_concorrentes_compartilham_uma_execucao():
+    # Arrange
+    flight = SingleFlight()
+    started, release = Event(), Event()
+    calls = []
+
+    def slow_query():
+        calls.append(1)
+        started.set()
+        release.wait(TIMEOUT)
+        return 'página'
+
+    followers = 3
+
+    # Act
+    with ThreadPoolExecutor(followers + 1) as pool:
+        leader = pool.submit(flight.do, 'users', slow_query)
+        assert started.wait(TIMEOUT)
+        others = [
+            pool.submit(flight.do, 'users', slow_query)
+            for _ in range(followers)
+        ]
+        # Espera os demais entrarem na fila do líder antes de liberá-lo
+        assert wait_until(lambda: flight.stats()['coalesced'] == followers)
+        release.set()
+        results = [leader.result()] + [f.result() for f in others]
+
+    # Assert
+    assert results == ['página'] * (followers + 1)
+    assert len(calls) == 1
+    assert flight.stats() == {
+        'in_flight': 0,
+        'leaders': 1,
+        'coalesced': followers,
+        'reused': 0,
+        'timeouts': 0,
+    }
+
+
+def test_erro_do_lider_chega_aos_que_esperam():
+    flight = SingleFlight()
+    started, release = Event(), Event()
+
+    def failing_query():
+        started.set()
+        release.wait(TIMEOUT)
+        raise ValueError('falhou')
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, 'users', failing_query)
+        assert started.wait(TIMEOUT)
+        follower = pool.submit(flight.do, 'users', failing_query)
+        assert wait_until(lambda: flight.stats()['coalesced'])
+        release.set()
+
+        with pytest.raises(ValueError, match='falhou'):
+            leader.result()
+        with pytest.raises(ValueError, match='falhou'):
+            follower.result()
+
+
+def test_lider_travado_nao_prende_quem_espera():
+    # Arrange: o líder só termina depois que o seguidor desistir
+    flight = SingleFlight(wait_timeout=POLL_INTERVAL)
+    started, release = Event(), Event()
+
+    def stuck_query():
+        started.set()
+        release.wait(TIMEOUT)
+        return 'líder'
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, 'users', stuck_query)
+        assert started.wait(TIMEOUT)
+
+        # Act
+        result = flight.do('users', lambda: 'sozinho')
+        release.set()
+
+        # Assert
+        assert result == 'sozinho'
+        assert leader.result() == 'líder'
+        assert flight.stats()['timeouts'] == 1
+
+
+def test_sem_janela_cada_chamada_sequencial_executa():
+    flight = SingleFlight()
+    calls = []
+
+    for _ in range(SEQUENTIAL_CALLS):
+        flight.do('users', lambda: calls.append(1))
+
+    assert len(calls) == SEQUENTIAL_CALLS
+
+
+def test_janela_de_reuso_reaproveita_resultado():
+    flight = SingleFlight(reuse_seconds=60)
+    calls = []
+
+    def query():
+        calls.append(1)
+        return len(calls)
+
+    first = flight.do('users', query)
+    second = flight.do('users', query)
+    other_key = flight.do('usernames', query)
+
+    assert first == second
+    assert other_key != first
+    assert flight.stats()['reused'] == 1
+
+
+def test_coalescing_stats(client, user):
+    client.get('/users/')
+
+    response = client.get('/coalescing/stats')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['leaders'] >= 1
@@ -0,0 +1,87 @@
+from http import HTTPStatus
+
+from sqlalchemy import update
+
+from fast_zero.models import User
+from fast_zero.queries import user_update_query
+
+UPDATE = {'username': 'chris', 'password': 'senha', 'email': 'c@market.com'}
+
+
+def test_get_users_not_modified(client, user):
+    # Arrange
+    etag = client.get('/users/').headers['ETag']
+
+    # Act
+    response = client.get('/users/', headers={'If-None-Match': etag})
+
+    # Assert
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers['ETag'] == etag
+    assert not response.content
+
+
+def test_get_user_not_modified(client, user):
+    # Arrange
+    etag = client.get('/users/1').headers['ETag']
+
+    # Act
+    response = client.get('/users/1', headers={'If-None-Match': etag})
+
+    # Assert
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_etag_muda_apos_update(client, user):
+    # Arrange
+    etag = client.get('/users/').headers['ETag']
+    client.put('/users/1', json=UPDATE)
+
+    # Act
+    response = client.get('/users/', headers={'If-None-Match': etag})
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['ETag'] != etag
+
+
+def test_update_user_if_match(client, user):
+    # Arrange
+    etag = client.get('/users/1').headers['ETag']
+
+    # Act
+    response = client.put('/users/1', json=UPDATE, headers={'If-Match': etag})
+    stale = client.put('/users/1', json=UPDATE, headers={'If-Match': etag})
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['ETag'] != etag
+    assert stale.status_code == HTTPStatus.PRECONDITION_FAILED
+
+
+def test_update_user_if_match_fraco_nao_casa(client, user):
+    etag = client.get('/users/1').headers['ETag']
+
+    response = client.put(
+        '/users/1', json=UPDATE, headers={'If-Match': f'W/{etag}'}
+    )
+
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+
+
+def test_update_condicional_perde_corrida(session, user):
+    # Arrange: o handler leu a linha e outra requisição a alterou depois
+    seen = User(
+        username=user.username, email=user.email, password=user.password
+    )
+    session.execute(
+        update(User).where(User.id == user.id).values(password='outra')
+    )
+
+    # Act
+    row = session.execute(
+        user_update_query(user.id, {'username': 'novo'}, seen)
+    ).one_or_none()
+
+    # Assert
+    assert row is None
@@ -0,0 +1,49 @@
+import re
+import subprocess
+import sys
+
+# Orçamento de cold start para `import fast_zero.app` (segundos)
+IMPORT_BUDGET = 2.0
+
+
+def import_time() -> float:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import fast_zero.app'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Formato: "import time: self [us] | cumulative | nome"
+    cumulative = re.search(
+        r'^import time:\s+\d+ \|\s+(\d+) \| fast_zero\.app$',
+        result.stderr,
+        re.MULTILINE,
+    )
+    return int(cumulative.group(1)) / 1_000_000
+
+
+def test_import_fast_zero_app_dentro_do_orcamento():
+    # Act
+    best = min(import_time() for _ in range(3))
+
+    # Assert
+    assert best < IMPORT_BUDGET
+
+
+def test_import_nao_cria_engine():
+    # Act
+    result = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import fast_zero.app\n'
+            'from fast_zero.database import get_engine\n'
+            'print(get_engine.cache_info().currsize)',
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Assert
+    assert result.stdout.strip() == '0'
@@ -0,0 +1,30 @@
+from http import HTTPStatus
+
+
+def test_metrics_usa_template_da_rota(client, user):
+    # Arrange
+    client.get('/users/1')
+
+    # Act
+    response = client.get('/metrics')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'].startswith('text/plain')
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/users/{user_id}",status="200"}'
+    ) in response.text
+    assert 'route="/users/1"' not in response.text
+    assert 'http_requests_in_flight' in response.text
+
+
+def test_metrics_rota_inexistente(client):
+    # Arrange
+    client.get('/nao/existe')
+
+    # Act
+    response = client.get('/metrics')
+
+    # Assert
+    assert 'route="unmatched",status="404"' in response.text
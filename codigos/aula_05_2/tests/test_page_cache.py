@@ -0,0 +1,135 @@
+from http import HTTPStatus
+
+import pytest
+
+from fast_zero import database
+from fast_zero.page_cache import MemoryPageCache, SQLitePageCache
+from fast_zero.replicas import ReplicaRouter
+
+TTL = 60
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def make_cache(request, tmp_path):
+    def make(max_bytes, ttl=TTL):
+        if request.param == 'sqlite':
+            return SQLitePageCache(str(tmp_path / 'pages.db'), max_bytes, ttl)
+        return MemoryPageCache(max_bytes, ttl)
+
+    return make
+
+
+def test_descarta_as_mais_antigas_pelo_tamanho_em_bytes(make_cache):
+    # Arrange
+    cache = make_cache(max_bytes=10)
+    cache.set('a', b'12345')
+    cache.set('b', b'12345')
+
+    # Act: não cabe junto com as duas anteriores
+    cache.set('c', b'123')
+
+    # Assert
+    assert cache.get('a') is None
+    assert cache.get('b') == b'12345'
+    assert cache.get('c') == b'123'
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['bytes'] == len(b'12345123')
+
+
+def test_memory_hit_renova_a_recencia():
+    # Arrange
+    cache = MemoryPageCache(max_bytes=10, ttl=TTL)
+    cache.set('a', b'12345')
+    cache.set('b', b'12345')
+    cache.get('a')
+
+    # Act
+    cache.set('c', b'123')
+
+    # Assert
+    assert cache.get('a') == b'12345'
+    assert cache.get('b') is None
+
+
+def test_pagina_maior_que_o_limite_nao_e_guardada(make_cache):
+    cache = make_cache(max_bytes=4)
+
+    cache.set('a', b'12345')
+
+    assert cache.get('a') is None
+
+
+def test_bump_incrementa_a_geracao(make_cache):
+    cache = make_cache(max_bytes=10)
+    generation = cache.generation()
+
+    cache.bump()
+
+    assert cache.generation() == generation + 1
+
+
+def test_pagina_expira_pelo_ttl(make_cache):
+    cache = make_cache(max_bytes=10, ttl=0)
+
+    cache.set('a', b'123')
+
+    assert cache.get('a') is None
+
+
+def test_sqlite_hit_recente_nao_escreve(tmp_path):
+    # Arrange
+    cache = SQLitePageCache(str(tmp_path / 'pages.db'), 100, TTL)
+    cache.set('a', b'123')
+    conn = cache._connection()
+    changes = conn.total_changes
+
+    # Act
+    cache.get('a')
+
+    # Assert
+    assert conn.total_changes == changes
+
+
+def test_sqlite_compartilha_paginas_e_geracao(tmp_path):
+    path = str(tmp_path / 'pages.db')
+    worker_a = SQLitePageCache(path, max_bytes=100, ttl=TTL)
+    worker_b = SQLitePageCache(path, max_bytes=100, ttl=TTL)
+
+    worker_a.set('users:0', b'pagina')
+    worker_a.bump()
+
+    assert worker_b.get('users:0') == b'pagina'
+    assert worker_b.generation() == 1
+
+
+def test_read_users_serve_pagina_do_cache(client, user):
+    client.get('/users/')
+
+    response = client.get('/users/')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['users'][0]['username'] == user.username
+    assert client.get('/cache/pages/stats').json()['hits'] >= 1
+
+
+def test_escrita_invalida_paginas_em_cache(client, user):
+    # Arrange
+    client.get('/users/')
+
+    # Act
+    client.patch(f'/users/{user.id}', json={'username': 'novo'})
+    response = client.get('/users/')
+
+    # Assert
+    assert response.json()['users'][0]['username'] == 'novo'
+
+
+def test_com_replicas_cache_tambem_e_preenchido(client, user, monkeypatch):
+    monkeypatch.setattr(
+        database, 'get_replica_router', lambda: ReplicaRouter([], '')
+    )
+    client.get('/users/')
+
+    client.get('/users/')
+
+    assert client.get('/cache/pages/stats').json()['size'] == 1
@@ -0,0 +1,150 @@
+from http import HTTPStatus
+from threading import Event, Timer
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool, SingletonThreadPool
+
+from fast_zero.app import app
+from fast_zero.cache import user_cache
+from fast_zero.database import get_read_session, pool_options
+from fast_zero.pool_stats import PoolStats, timed_pool
+from fast_zero.schemas import UserPublic
+from fast_zero.settings import Settings
+
+HOLD_SECONDS = 0.1
+
+
+def single_connection_engine(path, stats, timeout=1):
+    # Pool com uma única conexão, para provocar espera/esgotamento
+    return create_engine(
+        f'sqlite:///{path}/pool.db',
+        poolclass=timed_pool(QueuePool, stats),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=timeout,
+    )
+
+
+def test_pool_stats_contadores(tmp_path):
+    # Arrange
+    engine = create_engine(f'sqlite:///{tmp_path}/pool.db')
+    stats = PoolStats()
+    stats.attach(engine.pool)
+
+    # Act
+    with engine.connect() as conn:
+        conn.execute(text('SELECT 1'))
+        during = stats.snapshot()
+    engine.dispose()
+    after = stats.snapshot()
+
+    # Assert
+    assert during['checked_out'] == 1
+    assert after['checked_out'] == 0
+    assert after['checkouts'] == 1
+    assert after['connects'] == 1
+    assert after['disconnects'] == 1
+
+
+def test_invalidate_conta_uma_desconexao(tmp_path):
+    engine = create_engine(f'sqlite:///{tmp_path}/pool.db')
+    stats = PoolStats()
+    stats.attach(engine.pool)
+
+    with engine.connect() as conn:
+        conn.invalidate()
+
+    assert stats.snapshot()['disconnects'] == 1
+
+
+def test_timed_pool_mede_espera_no_checkout(tmp_path):
+    # Arrange: a única conexão só é devolvida depois de HOLD_SECONDS
+    stats = PoolStats()
+    engine = single_connection_engine(tmp_path, stats)
+    held = engine.connect()
+    Timer(HOLD_SECONDS, held.close).start()
+
+    # Act
+    with engine.connect():
+        pass
+
+    # Assert
+    assert stats.snapshot()['wait_seconds_max'] >= HOLD_SECONDS / 2
+
+
+def test_timed_pool_nao_conta_abertura_de_conexao(tmp_path):
+    # Arrange: pool livre, mas abrir a conexão leva HOLD_SECONDS
+    stats = PoolStats()
+    engine = single_connection_engine(tmp_path, stats)
+    event.listen(
+        engine.pool, 'connect', lambda *_: Event().wait(HOLD_SECONDS)
+    )
+
+    # Act
+    with engine.connect():
+        pass
+
+    # Assert
+    assert stats.snapshot()['wait_seconds_max'] < HOLD_SECONDS / 2
+
+
+def test_pool_options_sem_fila_para_sqlite_em_memoria():
+    settings = Settings(DATABASE_URL='sqlite://')
+
+    options = pool_options('sqlite://', settings)
+    engine = create_engine('sqlite://', **options)
+
+    assert 'pool_size' not in options
+    assert isinstance(engine.pool, SingletonThreadPool)
+
+
+def test_resposta_do_cache_nao_ocupa_conexao(tmp_path, client):
+    # Arrange: pool esgotado e perfil já no cache
+    engine = single_connection_engine(tmp_path, PoolStats(), timeout=0.2)
+    held = engine.connect()
+    user = UserPublic(id=1, username='teste', email='teste@test.com')
+    user_cache.set(user.id, (user, '"etag"'))
+
+    def exhausted_session():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_read_session] = exhausted_session
+
+    # Act
+    response = client.get(f'/users/{user.id}')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    held.close()
+
+
+def test_pool_stats_wait():
+    # Arrange
+    stats = PoolStats()
+    slow, fast = 0.5, 0.25
+
+    # Act
+    stats.record_wait(slow)
+    stats.record_wait(fast)
+
+    # Assert
+    assert stats.snapshot()['wait_seconds_total'] == slow + fast
+    assert stats.snapshot()['wait_seconds_max'] == slow
+
+
+def test_read_pool_stats(client):
+    # Act
+    response = client.get('/pool/stats')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert set(response.json()) == {
+        'checked_out',
+        'checkouts',
+        'connects',
+        'disconnects',
+        'wait_seconds_total',
+        'wait_seconds_max',
+    }
@@ -0,0 +1,43 @@
+from http import HTTPStatus
+
+import pytest
+
+
+def test_server_timing_header(client, user):
+    # Act
+    response = client.get('/users/')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['Server-Timing'].startswith('db;dur=')
+    assert response.headers['Server-Timing'].endswith('desc="1 queries"')
+
+
+def test_create_user_uma_query(client, assert_max_queries):
+    # Act
+    with assert_max_queries(1) as stats:
+        client.post(
+            '/users/',
+            json={'username': 'kenan', 'password': 'kel', 'email': 'k@k.com'},
+        )
+
+    # Assert
+    assert stats.count == 1
+
+
+def test_assert_max_queries_falha(client, user, assert_max_queries):
+    # Act / Assert
+    with pytest.raises(AssertionError), assert_max_queries(0):
+        client.get('/users/')
+
+
+def test_statement_com_erro_e_contado(client, user):
+    # Act: username duplicado, o INSERT falha com IntegrityError
+    response = client.post(
+        '/users/',
+        json={'username': user.username, 'password': 'x', 'email': 'n@n.com'},
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.headers['Server-Timing'].endswith('desc="1 queries"')
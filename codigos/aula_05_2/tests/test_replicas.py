@@ -0,0 +1,93 @@
+from http import HTTPStatus
+from time import time
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from fast_zero import database
+from fast_zero.cache import user_cache
+from fast_zero.replicas import (
+    PRIMARY_COOKIE,
+    ReplicaRouter,
+    pinned_to_primary,
+    read_your_writes_middleware,
+)
+
+
+def make_engines(count):
+    return [
+        create_engine('sqlite://', poolclass=QueuePool) for _ in range(count)
+    ]
+
+
+def test_round_robin_alterna_entre_replicas():
+    engines = make_engines(2)
+    router = ReplicaRouter(engines, 'round_robin')
+
+    chosen = [router.choose() for _ in range(4)]
+
+    assert chosen == [engines[0], engines[1], engines[0], engines[1]]
+
+
+def test_least_connections_escolhe_replica_menos_ocupada():
+    engines = make_engines(2)
+    router = ReplicaRouter(engines, 'least_connections')
+
+    with engines[0].connect():
+        chosen = router.choose()
+
+    assert chosen is engines[1]
+
+
+def test_escrita_fixa_cliente_no_primario():
+    app = FastAPI()
+    app.middleware('http')(read_your_writes_middleware(5))
+
+    @app.post('/')
+    def write():
+        return {}
+
+    @app.get('/')
+    def read(request: Request):
+        return {'primary': pinned_to_primary(request)}
+
+    client = TestClient(app)
+
+    # Arrange: antes de escrever, lê da réplica
+    assert client.get('/').json() == {'primary': False}
+
+    # Act
+    response = client.post('/')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert float(response.cookies[PRIMARY_COOKIE]) > time()
+    assert client.get('/').json() == {'primary': True}
+
+
+def test_sem_replicas_escrita_nao_define_cookie(client):
+    response = client.post(
+        '/users/',
+        json={'username': 'ana', 'email': 'ana@test.com', 'password': 'x'},
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert PRIMARY_COOKIE not in response.cookies
+
+
+def test_leitura_da_replica_nao_preenche_user_cache(client, user, monkeypatch):
+    # Arrange: há réplicas e o cliente não está fixado no primário
+    monkeypatch.setattr(
+        database, 'get_replica_router', lambda: ReplicaRouter([], '')
+    )
+
+    # Act
+    single = client.get(f'/users/{user.id}')
+    batch = client.get(f'/users/batch?ids={user.id}')
+
+    # Assert
+    assert single.status_code == HTTPStatus.OK
+    assert batch.json()['users'][0]['id'] == user.id
+    assert user_cache.get(user.id) is None
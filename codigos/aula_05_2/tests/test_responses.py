@@ -0,0 +1,53 @@
+from fastapi.responses import JSONResponse
+
+from fast_zero.models import User
+from fast_zero.schemas import UserList, UsernameList, UserPublic
+
+
+def default_render(model):
+    # Serialização padrão da FastAPI (response_model + JSONResponse)
+    return JSONResponse(model.model_dump(exclude_none=True)).body
+
+
+def test_read_users_bytes_iguais_ao_padrao(client, session):
+    # Arrange
+    users = [
+        User(username='joão', email='joao@são.com', password='x'),
+        User(username='"aspas"\\n', email='aspas@test.com', password='x'),
+    ]
+    session.add_all(users)
+    session.commit()
+    expected = UserList(users=[UserPublic.model_validate(u) for u in users])
+
+    # Act
+    response = client.get('/users/')
+
+    # Assert
+    assert response.content == default_render(expected)
+
+
+def test_read_users_bytes_iguais_com_cursor(client, session):
+    # Arrange
+    user = User(username='ana', email='ana@test.com', password='x')
+    session.add(user)
+    session.commit()
+
+    # Act
+    response = client.get('/users/?limit=1')
+
+    # Assert
+    expected = UserList(
+        users=[UserPublic.model_validate(user)],
+        next_cursor=response.json()['next_cursor'],
+    )
+    assert response.content == default_render(expected)
+
+
+def test_unique_usernames_bytes_iguais_ao_padrao(client, user):
+    # Act
+    response = client.get('/users/unique_usernames')
+
+    # Assert
+    assert response.content == default_render(
+        UsernameList(usernames=[user.username])
+    )
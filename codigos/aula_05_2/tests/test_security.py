@@ -0,0 +1,77 @@
+from http import HTTPStatus
+from threading import Event
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Select
+
+from fast_zero.models import User
+from fast_zero.security import HashingPool, verify_password
+
+
+def test_create_user_salva_hash_da_senha(client, session):
+    # Act
+    client.post(
+        '/users/',
+        json={'username': 'kenan', 'password': 'kel', 'email': 'k@kel.com'},
+    )
+
+    # Assert
+    db_user = session.scalar(Select(User).where(User.username == 'kenan'))
+    assert db_user.password != 'kel'
+    assert verify_password('kel', db_user.password)
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_hashing_pool_hash_e_verify(workers):
+    # Arrange
+    pool = HashingPool(workers=workers, queue_size=0, processes=False)
+
+    # Act
+    hashed = pool.hash('senha')
+
+    # Assert
+    assert pool.verify('senha', hashed)
+    assert not pool.verify('outra', hashed)
+
+
+def test_hashing_pool_fila_cheia():
+    # Arrange
+    pool = HashingPool(workers=1, queue_size=0, processes=False)
+    release = Event()
+    pool.submit(release.wait)
+
+    # Act
+    with pytest.raises(HTTPException) as exc:
+        pool.submit(release.wait)
+    release.set()
+
+    # Assert
+    assert exc.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+
+
+def test_hash_many_em_janelas_devolve_as_vagas():
+    # Arrange: 2 workers, sem fila extra; 3 senhas = janelas de 2 e 1
+    workers = 2
+    pool = HashingPool(workers=workers, queue_size=0, processes=False)
+    passwords = ['a', 'b', 'c']
+
+    # Act
+    hashes = pool.hash_many(passwords)
+
+    # Assert: todas as vagas livres de novo e hashes na ordem das senhas
+    assert all(map(verify_password, passwords, hashes))
+    for _ in range(workers):
+        pool.submit(len, '')
+
+
+def test_hash_many_sem_vagas_retorna_503():
+    pool = HashingPool(workers=1, queue_size=0, processes=False)
+    release = Event()
+    pool.submit(release.wait)
+
+    with pytest.raises(HTTPException) as exc:
+        pool.hash_many(['a', 'b'])
+    release.set()
+
+    assert exc.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
@@ -0,0 +1,37 @@
+from sqlalchemy import create_engine
+
+from fast_zero import sqlite_tuning
+from fast_zero.settings import Settings
+
+
+def test_pragmas_aplicados_na_conexao(tmp_path):
+    # Arrange
+    settings = Settings(SQLITE_TUNING=True, SQLITE_BUSY_TIMEOUT=1234)
+    engine = create_engine(f'sqlite:///{tmp_path}/tuning.db')
+    sqlite_tuning.attach(engine, settings)
+
+    # Act
+    with engine.connect() as conn:
+        journal_mode = conn.exec_driver_sql('PRAGMA journal_mode').scalar()
+        synchronous = conn.exec_driver_sql('PRAGMA synchronous').scalar()
+        busy_timeout = conn.exec_driver_sql('PRAGMA busy_timeout').scalar()
+
+    # Assert
+    assert journal_mode == 'wal'
+    assert synchronous == 1  # NORMAL
+    assert busy_timeout == settings.SQLITE_BUSY_TIMEOUT
+    engine.dispose()
+
+
+def test_pragmas_desabilitados_por_padrao(tmp_path):
+    # Arrange
+    engine = create_engine(f'sqlite:///{tmp_path}/padrao.db')
+    sqlite_tuning.attach(engine, Settings())
+
+    # Act
+    with engine.connect() as conn:
+        journal_mode = conn.exec_driver_sql('PRAGMA journal_mode').scalar()
+
+    # Assert
+    assert journal_mode == 'delete'
+    engine.dispose()
@@ -0,0 +1,39 @@
+from http import HTTPStatus
+
+from sqlalchemy import create_engine, func, select
+
+from fast_zero.models import User, table_registry
+from fast_zero.query_stats import attach, count_queries
+from fast_zero.warmup import hot_statements, warm_up
+
+POOL_SIZE = 3
+
+
+def test_warm_up_abre_pool_e_executa_statements(tmp_path):
+    # Arrange
+    engine = create_engine(
+        f'sqlite:///{tmp_path}/warmup.db', pool_size=POOL_SIZE
+    )
+    table_registry.metadata.create_all(engine)
+    attach(engine)
+
+    # Act
+    with count_queries() as stats:
+        warm_up(engine, connections=POOL_SIZE)
+
+    # Assert
+    assert engine.pool.checkedin() == POOL_SIZE
+    assert stats.count == len(hot_statements())
+    # O INSERT de warm-up foi desfeito
+    with engine.connect() as connection:
+        assert connection.scalar(select(func.count(User.id))) == 0
+    engine.dispose()
+
+
+def test_health_ready(client):
+    # Act
+    response = client.get('/health/ready')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'message': 'pronto'}